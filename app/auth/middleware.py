@@ -113,6 +113,7 @@ async def auth_middleware(request: Request, call_next):
         if request.url.path in [
             "/health",
             "/metrics",
+            "/metrics.json",
             "/docs",
             "/openapi.json",
             "/api/v1/services/test",
@@ -5,6 +5,7 @@ Handles loading/saving UI settings and cache configuration
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
@@ -12,6 +13,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Serialises settings writes from the UI thread and background save jobs
+_save_lock = threading.Lock()
+
 
 @dataclass
 class CacheSettings:
@@ -66,6 +70,16 @@ class LogSettings:
     clear_on_startup: bool = False  # Clear logs when starting the UI
 
 
+@dataclass
+class PollingSettings:
+    """UI polling interval settings (milliseconds)"""
+
+    status_interval: int = 2000  # Status poll interval after a state change
+    status_max_interval: int = 30000  # Backoff ceiling while status is idle
+    logs_interval: int = 5000  # Log refresh interval after new output
+    logs_max_interval: int = 30000  # Backoff ceiling while logs are idle
+
+
 @dataclass
 class UISettings:
     """Complete UI settings structure"""
@@ -75,6 +89,7 @@ class UISettings:
     window: WindowSettings = None
     service: ServiceSettings = None
     logs: LogSettings = None
+    polling: PollingSettings = None
 
     def __post_init__(self):
         if self.cache is None:
@@ -87,6 +102,8 @@ class UISettings:
             self.service = ServiceSettings()
         if self.logs is None:
             self.logs = LogSettings()
+        if self.polling is None:
+            self.polling = PollingSettings()
 
 
 class UIConfigManager:
@@ -110,6 +127,7 @@ class UIConfigManager:
                 window_data = data.get("window", {})
                 service_data = data.get("service", {})
                 logs_data = data.get("logs", {})
+                polling_data = data.get("polling", {})
 
                 self.settings = UISettings(
                     cache=CacheSettings(**cache_data),
@@ -117,6 +135,7 @@ class UIConfigManager:
                     window=WindowSettings(**window_data),
                     service=ServiceSettings(**service_data),
                     logs=LogSettings(**logs_data),
+                    polling=PollingSettings(**polling_data),
                 )
 
                 logger.info("UI settings loaded successfully")
@@ -131,19 +150,27 @@ class UIConfigManager:
         return self.settings
 
     def save_settings(self) -> bool:
-        """Save settings to JSON file"""
-        try:
-            # Convert dataclasses to dict for JSON serialization
-            data = {
-                "cache": asdict(self.settings.cache),
-                "startup": asdict(self.settings.startup),
-                "window": asdict(self.settings.window),
-                "service": asdict(self.settings.service),
-                "logs": asdict(self.settings.logs),
-            }
+        """Save settings to JSON file
 
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        Writes a temporary file and replaces the original, under a lock, so
+        overlapping saves never leave a truncated or interleaved file behind.
+        """
+        try:
+            with _save_lock:
+                # Convert dataclasses to dict for JSON serialization
+                data = {
+                    "cache": asdict(self.settings.cache),
+                    "startup": asdict(self.settings.startup),
+                    "window": asdict(self.settings.window),
+                    "service": asdict(self.settings.service),
+                    "logs": asdict(self.settings.logs),
+                    "polling": asdict(self.settings.polling),
+                }
+
+                tmp_file = self.config_file.with_suffix(".json.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_file, self.config_file)
 
             logger.info("UI settings saved successfully")
             return True
@@ -191,6 +218,30 @@ class UIConfigManager:
             logger.error(f"Failed to set cache setting: {e}")
             return False
 
+    def update_cache_settings(self, **settings: bool) -> bool:
+        """Set several cache settings at once and save them in a single write"""
+        fields = {
+            "states": "states_enabled",
+            "services": "services_enabled",
+            "config": "config_enabled",
+            "states_individual": "states_individual_enabled",
+            "services_individual": "services_individual_enabled",
+        }
+        try:
+            unknown = [name for name in settings if name not in fields]
+            if unknown:
+                logger.warning(f"Unknown cache types: {', '.join(unknown)}")
+                return False
+
+            for cache_type, enabled in settings.items():
+                setattr(self.settings.cache, fields[cache_type], enabled)
+
+            return self.save_settings()
+
+        except Exception as e:
+            logger.error(f"Failed to update cache settings: {e}")
+            return False
+
     def get_startup_setting(self, setting: str) -> Any:
         """Get startup setting"""
         if setting == "run_on_login":
@@ -251,8 +302,35 @@ class UIConfigManager:
             logger.error(f"Failed to set log setting: {e}")
             return False
 
+    def get_polling_setting(self, setting: str) -> Any:
+        """Get polling setting"""
+        if hasattr(self.settings.polling, setting):
+            return getattr(self.settings.polling, setting)
+        else:
+            logger.warning(f"Unknown polling setting: {setting}")
+            return None
+
+    def set_polling_setting(self, setting: str, value: int) -> bool:
+        """Set polling setting"""
+        try:
+            if hasattr(self.settings.polling, setting):
+                setattr(self.settings.polling, setting, int(value))
+            else:
+                logger.warning(f"Unknown polling setting: {setting}")
+                return False
+
+            return self.save_settings()
+
+        except Exception as e:
+            logger.error(f"Failed to set polling setting: {e}")
+            return False
+
     def get_all_settings(self) -> UISettings:
-        """Get all current settings"""
+        """Get all current settings
+
+        Returns the in-memory snapshot loaded at construction and updated by
+        every setter, so the file is parsed once. Callers must not mutate it.
+        """
         return self.settings
 
     def reset_to_defaults(self) -> bool:
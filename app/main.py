@@ -210,6 +210,15 @@ async def metrics():
     return get_metrics_response()
 
 
+@app.get("/metrics.json")
+async def metrics_summary():
+    """Metric totals as JSON for the desktop dashboard."""
+    if not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=404, content={"error": "Metrics disabled"})
+
+    return metrics_collector.get_metrics_summary()
+
+
 @app.get("/queue/status")
 async def queue_status():
     """Priority queue status endpoint."""
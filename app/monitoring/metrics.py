@@ -6,12 +6,23 @@ from prometheus_client import (
     Gauge,
     generate_latest,
     CONTENT_TYPE_LATEST,
+    REGISTRY,
 )
 from fastapi import Request, Response
 import structlog
 
 logger = structlog.get_logger()
 
+# Samples exposed by /metrics.json, summed across all label sets
+SUMMARY_METRICS = (
+    "ha_bridge_requests_total",
+    "ha_bridge_errors_total",
+    "ha_bridge_request_duration_seconds_sum",
+    "ha_bridge_request_duration_seconds_count",
+    "ha_bridge_cache_hits_total",
+    "ha_bridge_cache_misses_total",
+)
+
 
 class MetricsCollector:
     """Prometheus metrics collector for the bridge service."""
@@ -101,6 +112,15 @@ class MetricsCollector:
         """Get Prometheus metrics in text format."""
         return generate_latest()
 
+    def get_metrics_summary(self) -> Dict[str, float]:
+        """Get dashboard metric totals without rendering the text format."""
+        summary = dict.fromkeys(SUMMARY_METRICS, 0.0)
+        for family in REGISTRY.collect():
+            for sample in family.samples:
+                if sample.name in summary:
+                    summary[sample.name] += sample.value
+        return summary
+
 
 # Global metrics collector instance
 metrics_collector = MetricsCollector()
@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.config.settings import settings
+from app.monitoring.metrics import SUMMARY_METRICS
 from app.clients.ha_client import HomeAssistantClient
 from app.models.schemas import StateResponse, ServiceResponse
 
@@ -32,6 +34,22 @@ class TestMetricsEndpoint:
         # Should return 200 or 404 depending on METRICS_ENABLED setting
         assert response.status_code in [200, 404]
 
+    def test_metrics_json_endpoint(self):
+        """Test metrics summary endpoint returns dashboard totals."""
+        with patch.object(settings, "METRICS_ENABLED", True):
+            response = client.get("/metrics.json")
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == set(SUMMARY_METRICS)
+        assert all(isinstance(value, (int, float)) for value in data.values())
+
+    def test_metrics_json_endpoint_skips_auth(self):
+        """Test metrics summary endpoint is exempt from authentication."""
+        headers = {"Authorization": "Bearer invalid-key"}
+        with patch.object(settings, "METRICS_ENABLED", True):
+            response = client.get("/metrics.json", headers=headers)
+        assert response.status_code == 200
+
 
 class TestStatusEndpoint:
     """Test status endpoint."""
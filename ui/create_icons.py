@@ -3,23 +3,59 @@ Icon Generator for HA Bridge Control UI
 Creates simple colored circle icons for system tray
 """
 
-from PIL import Image, ImageDraw
-import os
+import struct
+import zlib
+from functools import lru_cache
 from pathlib import Path
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@lru_cache(maxsize=None)
+def _circle_mask(size: int, margin: int = 2) -> bytes:
+    """Get the alpha coverage mask for a filled circle (255 inside, 0 outside)"""
+    center = size / 2
+    radius = (size - 2 * margin) / 2 + 0.5
+    return bytes(
+        255 if (x - center) ** 2 + (y - center) ** 2 <= radius**2 else 0
+        for y in range(size)
+        for x in range(size)
+    )
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Build a single PNG chunk (length, type, data, CRC)"""
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
 
-def create_circle_icon(size: int, color: str, filename: str):
-    """Create a simple colored circle icon"""
-    # Create image with transparent background
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
-    # Draw circle
-    margin = 2
-    draw.ellipse([margin, margin, size - margin, size - margin], fill=color)
+@lru_cache(maxsize=None)
+def circle_icon_png(size: int, color: str) -> bytes:
+    """Encode a colored circle icon as PNG bytes"""
+    rgb = int(color.lstrip("#"), 16).to_bytes(3, "big")
+    mask = _circle_mask(size)
 
-    # Save icon
-    img.save(filename, "PNG")
+    # Each scanline starts with filter type 0 (None), followed by RGBA pixels
+    raw = bytearray()
+    for y in range(size):
+        raw.append(0)
+        for alpha in mask[y * size : (y + 1) * size]:
+            raw += rgb if alpha else b"\x00\x00\x00"
+            raw.append(alpha)
+
+    # 8-bit depth, color type 6 (RGBA), default compression/filter/interlace
+    header = struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(bytes(raw), 9))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def create_circle_icon(size: int, color: str, filename: str):
+    """Create a simple colored circle icon"""
+    Path(filename).write_bytes(circle_icon_png(size, color))
     print(f"Created icon: {filename}")
 
 
@@ -0,0 +1,76 @@
+"""
+UI Event Bus for HA Bridge Control UI
+Pure-Python signals for widget-to-widget updates on the UI thread
+"""
+
+import logging
+import weakref
+from typing import Any, Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+class Signal:
+    """Minimal synchronous signal that never crosses into Qt
+
+    Callbacks run immediately on the emitting thread, so only emit from the
+    UI thread (worker results should arrive through a Qt signal first).
+    Bound methods are held weakly so subscribing doesn't keep widgets alive.
+    """
+
+    __slots__ = ("_refs",)
+
+    def __init__(self):
+        self._refs: List[Callable[[], Any]] = []
+
+    @staticmethod
+    def _make_ref(callback: Callable) -> Callable[[], Any]:
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return weakref.WeakMethod(callback)
+        return lambda: callback
+
+    def connect(self, callback: Callable) -> Callable:
+        """Subscribe a callback (connecting the same callback twice is a no-op)"""
+        if callback not in self._callbacks():
+            self._refs.append(self._make_ref(callback))
+        return callback
+
+    def disconnect(self, callback: Callable):
+        """Unsubscribe a callback"""
+        self._refs = [ref for ref in self._refs if ref() not in (None, callback)]
+
+    def _callbacks(self) -> List[Callable]:
+        callbacks = []
+        for ref in self._refs:
+            callback = ref()
+            if callback is not None:
+                callbacks.append(callback)
+        return callbacks
+
+    def emit(self, *args):
+        """Call every live subscriber with the given arguments"""
+        dead = False
+        for ref in tuple(self._refs):
+            callback = ref()
+            if callback is None:
+                dead = True
+                continue
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Event handler {callback!r} failed: {e}")
+
+        if dead:
+            self._refs = [ref for ref in self._refs if ref() is not None]
+
+
+class UIEvents:
+    """Events shared between the control panel widgets"""
+
+    def __init__(self):
+        self.status_changed = Signal()  # dict: latest service status
+        self.logs_received = Signal()  # list[str]: latest service log tail
+
+
+# Global instance for easy access
+ui_events = UIEvents()
@@ -0,0 +1,29 @@
+"""
+Tray Icon Cache for HA Bridge Control UI
+Loads each tray icon from disk once and shares the QIcon instances
+"""
+
+from pathlib import Path
+from typing import Dict
+
+from PyQt6.QtGui import QIcon
+
+ICONS_DIR = Path(__file__).parent / "assets" / "icons"
+TRAY_ICON_STATES = ("active", "inactive", "unknown")
+
+_ICONS: Dict[str, QIcon] = {}
+
+
+def get_tray_icon(status: str) -> QIcon:
+    """Get the cached tray icon for a status ("active", "inactive" or "unknown")"""
+    icon = _ICONS.get(status)
+    if icon is None:
+        icon = QIcon(str(ICONS_DIR / f"tray_icon_{status}.png"))
+        _ICONS[status] = icon
+    return icon
+
+
+def preload_tray_icons():
+    """Load every tray icon into the cache (requires a QApplication)"""
+    for status in TRAY_ICON_STATES:
+        get_tray_icon(status)
@@ -3,9 +3,9 @@ Main Control Window for HA Bridge Control UI
 Modern dark mode interface for managing the bridge service
 """
 
-import sys
 import logging
-from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -19,47 +19,90 @@ from PyQt6.QtWidgets import (
     QTextEdit,
     QGroupBox,
     QFrame,
-    QSpacerItem,
-    QSizePolicy,
-    QMessageBox,
-    QProgressBar,
     QSplitter,
-    QScrollArea,
     QTabWidget,
+    QApplication,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    QThreadPool,
+    QSignalBlocker,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QTextCursor
 
 from ui.service_controller import ServiceController
 from ui.startup_manager import StartupManager
 from ui.metrics_panel import MetricsPanel
+from ui.workers import StatusWorker, StatusUpdate, LogsWorker, FunctionJob
+from ui.events import ui_events
+from ui.ticker import UITicker, ms_to_ticks
 from app.config.ui_config import ui_config
 
 logger = logging.getLogger(__name__)
 
+# Connection type for signal wiring; a repeated connect() becomes a no-op
+_UNIQUE = Qt.ConnectionType.UniqueConnection
+
+# Shared inline style snippets (read-only so widgets can't mutate them)
+_STYLES = MappingProxyType(
+    {
+        "status_base": "font-weight: bold; font-size: 12pt;",
+        "status_ok": "color: #4ec9b0; font-weight: bold; font-size: 12pt;",
+        "status_bad": "color: #f48771; font-weight: bold; font-size: 12pt;",
+        "link": "color: #007acc;",
+        "ws_ok": "color: #4caf50;",
+        "ws_warn": "color: #ff9800;",
+        "ws_none": "color: #888;",
+        "muted": "color: #808080;",
+        "section_ok": "color: #4ec9b0; font-weight: bold; margin-top: 5px;",
+        "section_bad": "color: #f48771; font-weight: bold; margin-top: 5px;",
+        "warning_small": "color: #f48771; font-size: 8pt; font-style: italic;",
+    }
+)
+
+# Success flag -> (state property, message format)
+_RESULT_STYLES = {
+    True: ("ok", "✓ {}"),
+    False: ("bad", "✗ {}"),
+    None: ("info", "{}"),
+}
+
+
+def set_label_state(label: QLabel, state: str):
+    """Switch a result label's state property and re-apply its style
+
+    Colors for each state live in the QLabel[state] rules of dark.qss.
+    """
+    label.setProperty("state", state)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
+
+
+def show_result(label: QLabel, ok: Optional[bool], message: str):
+    """Show a success/failure/info message on a result label"""
+    state, fmt = _RESULT_STYLES[ok]
+    label.setText(fmt.format(message))
+    set_label_state(label, state)
+
 
 class LogViewer(QTextEdit):
     """Custom log viewer with auto-scroll and filtering"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_lines: int = 50):
         super().__init__(parent)
         self.setReadOnly(True)
-        # Note: setMaximumBlockCount is not available in PyQt6
-        # We'll handle log limiting differently
+        # QTextEdit has no setMaximumBlockCount, but its document does
+        self.document().setMaximumBlockCount(max_lines)
 
-        # Setup styling
-        self.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 9pt;
-            }
-        """
-        )
+        # Lines currently rendered, used to diff incoming log tails
+        self._log_cache: List[str] = []
+
+        # Styled by the "logViewer" rule in the application stylesheet
+        self.setObjectName("logViewer")
 
     def append_log(self, message: str):
         """Append a log message"""
@@ -68,23 +111,96 @@ class LogViewer(QTextEdit):
         scrollbar = self.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def append_logs(self, messages: List[str]):
+        """Append several log lines with a single cursor insert"""
+        if not messages:
+            return
+
+        text = "\n".join(messages)
+        if not self.document().isEmpty():
+            text = "\n" + text
+
+        self.setUpdatesEnabled(False)
+        try:
+            cursor = self.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(text)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def update_logs(self, logs: List[str]):
+        """Render a log tail, appending only lines not already shown"""
+        if logs == self._log_cache:
+            return
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        new_lines = self._new_lines(logs)
+        if new_lines is None:
+            # No overlap with what's rendered - repaint in one pass
+            self.setPlainText("\n".join(logs))
+        else:
+            self.append_logs(new_lines)
+
+        self._log_cache = list(logs)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _new_lines(self, logs: List[str]) -> Optional[List[str]]:
+        """Return lines of logs that follow the cached tail, or None if unrelated"""
+        cache = self._log_cache
+        if not cache:
+            return None
+
+        # Anchor on the last few cached lines before doing a full comparison
+        for shift in range(len(cache)):
+            overlap = len(cache) - shift
+            if overlap > len(logs):
+                continue
+            anchor = min(5, overlap)
+            if logs[overlap - anchor : overlap] != cache[-anchor:]:
+                continue
+            if logs[:overlap] == cache[shift:]:
+                return logs[overlap:]
+
+        return None
+
     def clear_logs(self):
         """Clear all logs"""
         self.clear()
+        self._log_cache = []
 
 
 class ServiceStatusWidget(QWidget):
     """Widget showing service status and controls"""
 
-    def __init__(self, service_controller: ServiceController, parent=None):
+    def __init__(
+        self, service_controller: ServiceController, ticker: UITicker, parent=None
+    ):
         super().__init__(parent)
         self.service_controller = service_controller
+        self.ticker = ticker
+        self._status_inflight = False
+        self._job_inflight = False
+
+        # Last (text, style) applied to each status label, to skip no-op updates
+        self._last_shown: Dict[QLabel, Tuple[str, Optional[str]]] = {}
+
+        # Adaptive polling: back off while the service state is unchanged
+        polling = ui_config.get_all_settings().polling
+        self._min_interval = polling.status_interval
+        self._max_interval = polling.status_max_interval
+        self._poll_interval = self._min_interval
+        self._last_state = None
+        self._last_poll_tick = ticker.count
+
         self.setup_ui()
+        ui_events.status_changed.connect(self._apply_status)
 
-        # Setup status update timer
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(2000)  # Update every 2 seconds
+        # Poll on the shared ticker rather than a timer of our own
+        self.ticker.tick.connect(self._on_tick, _UNIQUE)
 
         # Initial update
         self.update_status()
@@ -99,13 +215,13 @@ class ServiceStatusWidget(QWidget):
 
         # Status indicator
         self.status_label = QLabel("Unknown")
-        self.status_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
+        self.status_label.setStyleSheet(_STYLES["status_base"])
         status_layout.addWidget(QLabel("Status:"), 0, 0)
         status_layout.addWidget(self.status_label, 0, 1)
 
         # Service URL
         self.url_label = QLabel("http://127.0.0.1:8000")
-        self.url_label.setStyleSheet("color: #007acc;")
+        self.url_label.setStyleSheet(_STYLES["link"])
         status_layout.addWidget(QLabel("URL:"), 1, 0)
         status_layout.addWidget(self.url_label, 1, 1)
 
@@ -131,123 +247,177 @@ class ServiceStatusWidget(QWidget):
         control_layout = QHBoxLayout(control_group)
 
         self.start_btn = QPushButton("Start")
-        self.start_btn.clicked.connect(self.start_service)
+        self.start_btn.clicked.connect(self.start_service, _UNIQUE)
         control_layout.addWidget(self.start_btn)
 
         self.stop_btn = QPushButton("Stop")
-        self.stop_btn.clicked.connect(self.stop_service)
+        self.stop_btn.clicked.connect(self.stop_service, _UNIQUE)
         control_layout.addWidget(self.stop_btn)
 
         self.restart_btn = QPushButton("Restart")
-        self.restart_btn.clicked.connect(self.restart_service)
+        self.restart_btn.clicked.connect(self.restart_service, _UNIQUE)
         control_layout.addWidget(self.restart_btn)
 
         self.test_btn = QPushButton("Test Connection")
-        self.test_btn.clicked.connect(self.test_connection)
+        self.test_btn.clicked.connect(self.test_connection, _UNIQUE)
         control_layout.addWidget(self.test_btn)
 
         layout.addWidget(control_group)
 
         # Connection test result
         self.test_result = QLabel("")
-        self.test_result.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
+        set_label_state(self.test_result, "ok")
         layout.addWidget(self.test_result)
 
+    @pyqtSlot(int)
+    def _on_tick(self, tick: int):
+        """Poll status once the current interval has elapsed"""
+        if tick - self._last_poll_tick >= ms_to_ticks(self._poll_interval):
+            self._last_poll_tick = tick
+            self.update_status()
+
+    @pyqtSlot()
     def update_status(self):
+        """Request a service status update from the thread pool"""
+        # Skip the tick if the previous request hasn't completed yet
+        if self._status_inflight:
+            return
+
+        self._status_inflight = True
+        worker = StatusWorker(self.service_controller)
+        worker.signals.result.connect(self._on_status_result, _UNIQUE)
+        QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(object)
+    def _on_status_result(self, status: StatusUpdate):
+        """Publish a worker's status result on the UI event bus"""
+        self._status_inflight = False
+        ui_events.status_changed.emit(status)
+
+    def _apply_status(self, status: StatusUpdate):
         """Update service status display"""
         try:
-            status = self.service_controller.get_service_status()
-
             # Update status label
             if status["running"]:
                 if status["health"]:
-                    self.status_label.setText("Running")
-                    self.status_label.setStyleSheet(
-                        "color: #4ec9b0; font-weight: bold; font-size: 12pt;"
-                    )
+                    status_text, status_style = "Running", "status_ok"
                 else:
-                    self.status_label.setText("Running (Unhealthy)")
-                    self.status_label.setStyleSheet(
-                        "color: #f48771; font-weight: bold; font-size: 12pt;"
-                    )
+                    status_text, status_style = "Running (Unhealthy)", "status_bad"
             else:
-                self.status_label.setText("Stopped")
-                self.status_label.setStyleSheet(
-                    "color: #f48771; font-weight: bold; font-size: 12pt;"
-                )
+                status_text, status_style = "Stopped", "status_bad"
+            self._set_label(self.status_label, status_text, status_style)
 
             # Update other fields
-            self.uptime_label.setText(status.get("uptime", "N/A"))
-            self.pid_label.setText(str(status.get("pid", "N/A")))
+            uptime = status.get("uptime")
+            pid = status.get("pid")
+            self._set_label(self.uptime_label, uptime if uptime else "N/A")
+            self._set_label(self.pid_label, str(pid) if pid is not None else "N/A")
 
             # Update WebSocket status
-            if status["running"] and status["health"]:
-                ws_status = self.service_controller.get_websocket_status()
+            ws_status = status.get("websocket")
+            if ws_status is not None:
                 if ws_status.get("connected"):
-                    self.websocket_status.setText("✓ Connected")
-                    self.websocket_status.setStyleSheet("color: #4caf50;")
+                    self._set_label(self.websocket_status, "✓ Connected", "ws_ok")
                 else:
                     error = ws_status.get("error", "Disconnected")
                     attempts = ws_status.get("reconnect_attempts", 0)
-                    status_text = f"✗ {error}"
+                    ws_text = "✗ " + str(error)
                     if attempts > 0:
-                        status_text += f" (retry {attempts})"
-                    self.websocket_status.setText(status_text)
-                    self.websocket_status.setStyleSheet("color: #ff9800;")
+                        ws_text += f" (retry {attempts})"
+                    self._set_label(self.websocket_status, ws_text, "ws_warn")
             else:
-                self.websocket_status.setText("—")
-                self.websocket_status.setStyleSheet("color: #888;")
+                self._set_label(self.websocket_status, "—", "ws_none")
 
             # Update button states
-            self.start_btn.setEnabled(not status["running"])
-            self.stop_btn.setEnabled(status["running"])
-            self.restart_btn.setEnabled(True)
+            self._update_buttons(status["running"])
+
+            ws_connected = ws_status.get("connected") if ws_status else None
+            self._adjust_poll_interval(
+                (status["running"], status["health"], status["pid"], ws_connected)
+            )
 
         except Exception as e:
             logger.error(f"Failed to update status: {e}")
 
+    def _set_label(self, label: QLabel, text: str, style: Optional[str] = None):
+        """Set label text/style only when they differ from what was last shown"""
+        last = self._last_shown.get(label)
+        if last == (text, style):
+            return
+        if last is None or last[0] != text:
+            label.setText(text)
+        if style is not None and (last is None or last[1] != style):
+            label.setStyleSheet(_STYLES[style])
+        self._last_shown[label] = (text, style)
+
+    def _adjust_poll_interval(self, state: Tuple[Any, ...]):
+        """Double the poll interval while state is unchanged, reset on change"""
+        if state == self._last_state:
+            self._poll_interval = min(self._poll_interval * 2, self._max_interval)
+        else:
+            self._poll_interval = self._min_interval
+        self._last_state = state
+
+    def _update_buttons(self, running: bool):
+        """Enable control buttons for the given state, unless a job is running"""
+        idle = not self._job_inflight
+        self.start_btn.setEnabled(idle and not running)
+        self.stop_btn.setEnabled(idle and running)
+        self.restart_btn.setEnabled(idle)
+        self.test_btn.setEnabled(idle)
+
+    def _run_job(self, fn: Callable[[], Dict[str, Any]], pending_message: str):
+        """Run a controller operation on the thread pool"""
+        if self._job_inflight:
+            return
+
+        self._job_inflight = True
+        self._update_buttons(self._last_state[0] if self._last_state else False)
+        show_result(self.test_result, None, pending_message)
+
+        job = FunctionJob(fn)
+        job.signals.result.connect(self._on_job_done, _UNIQUE)
+        QThreadPool.globalInstance().start(job)
+
+    @pyqtSlot(object)
+    def _on_job_done(self, result: Optional[Dict[str, Any]]):
+        """Show a controller operation result and refresh status"""
+        self._job_inflight = False
+        if result is None:
+            result = {"success": False, "message": "Operation failed - see ui.log"}
+        self._show_result(result)
+
+        # Poll at full rate again since the service state likely changed
+        self._last_state = None
+        self._poll_interval = self._min_interval
+        self._last_poll_tick = self.ticker.count
+        self.update_status()
+
+    @pyqtSlot()
     def start_service(self):
         """Start the service"""
-        result = self.service_controller.start_service()
-        if result["success"]:
-            self.test_result.setText(f"✓ {result['message']}")
-            self.test_result.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
-        else:
-            self.test_result.setText(f"✗ {result['message']}")
-            self.test_result.setStyleSheet("color: #f48771; font-size: 10pt;")
+        self._run_job(self.service_controller.start_service, "Starting service...")
 
+    @pyqtSlot()
     def stop_service(self):
         """Stop the service"""
-        result = self.service_controller.stop_service()
-        if result["success"]:
-            self.test_result.setText(f"✓ {result['message']}")
-            self.test_result.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
-        else:
-            self.test_result.setText(f"✗ {result['message']}")
-            self.test_result.setStyleSheet("color: #f48771; font-size: 10pt;")
+        self._run_job(self.service_controller.stop_service, "Stopping service...")
 
+    @pyqtSlot()
     def restart_service(self):
         """Restart the service"""
-        result = self.service_controller.restart_service()
-        if result["success"]:
-            self.test_result.setText(f"✓ {result['message']}")
-            self.test_result.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
-        else:
-            self.test_result.setText(f"✗ {result['message']}")
-            self.test_result.setStyleSheet("color: #f48771; font-size: 10pt;")
+        self._run_job(
+            self.service_controller.restart_service, "Restarting service..."
+        )
 
+    @pyqtSlot()
     def test_connection(self):
         """Test connection to service"""
-        self.test_result.setText("Testing connection...")
-        self.test_result.setStyleSheet("color: #007acc; font-size: 10pt;")
+        self._run_job(self.service_controller.test_connection, "Testing connection...")
 
-        result = self.service_controller.test_connection()
-        if result["success"]:
-            self.test_result.setText(f"✓ {result['message']}")
-            self.test_result.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
-        else:
-            self.test_result.setText(f"✗ {result['message']}")
-            self.test_result.setStyleSheet("color: #f48771; font-size: 10pt;")
+    def _show_result(self, result: Dict[str, Any], success_key: str = "success"):
+        """Show a controller result on the test result label"""
+        show_result(self.test_result, result.get(success_key), result["message"])
 
 
 class CacheControlWidget(QWidget):
@@ -268,34 +438,34 @@ class CacheControlWidget(QWidget):
 
         # Bulk endpoint section label
         bulk_label = QLabel("Bulk Endpoints (✓ Recommended - Less HA Server Strain):")
-        bulk_label.setStyleSheet("color: #4ec9b0; font-weight: bold; margin-top: 5px;")
+        bulk_label.setStyleSheet(_STYLES["section_ok"])
         cache_layout.addWidget(bulk_label, 0, 0, 1, 2)
 
         # States API caching (/all)
         self.states_cache = QCheckBox("States API Caching (/all)")
-        self.states_cache.stateChanged.connect(self.on_cache_changed)
+        self.states_cache.stateChanged.connect(self.on_cache_changed, _UNIQUE)
         cache_layout.addWidget(self.states_cache, 1, 0)
 
         self.states_ttl = QLabel("TTL: 300s")
-        self.states_ttl.setStyleSheet("color: #808080;")
+        self.states_ttl.setStyleSheet(_STYLES["muted"])
         cache_layout.addWidget(self.states_ttl, 1, 1)
 
         # Services API caching (/all)
         self.services_cache = QCheckBox("Services API Caching (/all)")
-        self.services_cache.stateChanged.connect(self.on_cache_changed)
+        self.services_cache.stateChanged.connect(self.on_cache_changed, _UNIQUE)
         cache_layout.addWidget(self.services_cache, 2, 0)
 
         self.services_ttl = QLabel("TTL: 300s")
-        self.services_ttl.setStyleSheet("color: #808080;")
+        self.services_ttl.setStyleSheet(_STYLES["muted"])
         cache_layout.addWidget(self.services_ttl, 2, 1)
 
         # Config API caching
         self.config_cache = QCheckBox("Config API Caching")
-        self.config_cache.stateChanged.connect(self.on_cache_changed)
+        self.config_cache.stateChanged.connect(self.on_cache_changed, _UNIQUE)
         cache_layout.addWidget(self.config_cache, 3, 0)
 
         self.config_ttl = QLabel("TTL: 300s")
-        self.config_ttl.setStyleSheet("color: #808080;")
+        self.config_ttl.setStyleSheet(_STYLES["muted"])
         cache_layout.addWidget(self.config_ttl, 3, 1)
 
         # Separator
@@ -307,35 +477,33 @@ class CacheControlWidget(QWidget):
 
         # Individual endpoint section label with warning
         individual_label = QLabel("Individual Endpoints (⚠ Use with Caution):")
-        individual_label.setStyleSheet(
-            "color: #f48771; font-weight: bold; margin-top: 5px;"
-        )
+        individual_label.setStyleSheet(_STYLES["section_bad"])
         cache_layout.addWidget(individual_label, 5, 0, 1, 2)
 
         # Individual states caching
         self.states_individual_cache = QCheckBox(
             "Individual State Lookups (/states/{id})"
         )
-        self.states_individual_cache.stateChanged.connect(self.on_cache_changed)
+        self.states_individual_cache.stateChanged.connect(
+            self.on_cache_changed, _UNIQUE
+        )
         cache_layout.addWidget(self.states_individual_cache, 6, 0)
 
         states_warning = QLabel("⚠ May delay state updates")
-        states_warning.setStyleSheet(
-            "color: #f48771; font-size: 8pt; font-style: italic;"
-        )
+        states_warning.setStyleSheet(_STYLES["warning_small"])
         cache_layout.addWidget(states_warning, 6, 1)
 
         # Individual services caching
         self.services_individual_cache = QCheckBox(
             "Individual Service Lookups (/services/{domain})"
         )
-        self.services_individual_cache.stateChanged.connect(self.on_cache_changed)
+        self.services_individual_cache.stateChanged.connect(
+            self.on_cache_changed, _UNIQUE
+        )
         cache_layout.addWidget(self.services_individual_cache, 7, 0)
 
         services_warning = QLabel("⚠ May show stale services")
-        services_warning.setStyleSheet(
-            "color: #f48771; font-size: 8pt; font-style: italic;"
-        )
+        services_warning.setStyleSheet(_STYLES["warning_small"])
         cache_layout.addWidget(services_warning, 7, 1)
 
         # Info note
@@ -352,7 +520,7 @@ class CacheControlWidget(QWidget):
 
         # Apply button
         self.apply_btn = QPushButton("Apply Changes")
-        self.apply_btn.clicked.connect(self.apply_changes)
+        self.apply_btn.clicked.connect(self.apply_changes, _UNIQUE)
         self.apply_btn.setStyleSheet(
             """
             QPushButton {
@@ -375,7 +543,7 @@ class CacheControlWidget(QWidget):
 
         # Status message
         self.status_msg = QLabel("")
-        self.status_msg.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
+        set_label_state(self.status_msg, "ok")
         layout.addWidget(self.status_msg)
 
     def load_settings(self):
@@ -384,11 +552,17 @@ class CacheControlWidget(QWidget):
             settings = ui_config.get_all_settings()
 
             # Block signals during initial load to prevent "Settings changed" message
-            self.states_cache.blockSignals(True)
-            self.services_cache.blockSignals(True)
-            self.config_cache.blockSignals(True)
-            self.states_individual_cache.blockSignals(True)
-            self.services_individual_cache.blockSignals(True)
+            # (blockers are released when they go out of scope)
+            blockers = [
+                QSignalBlocker(checkbox)
+                for checkbox in (
+                    self.states_cache,
+                    self.services_cache,
+                    self.config_cache,
+                    self.states_individual_cache,
+                    self.services_individual_cache,
+                )
+            ]
 
             # Set checkbox states
             self.states_cache.setChecked(settings.cache.states_enabled)
@@ -400,44 +574,43 @@ class CacheControlWidget(QWidget):
             self.services_individual_cache.setChecked(
                 settings.cache.services_individual_enabled
             )
-
-            # Re-enable signals
-            self.states_cache.blockSignals(False)
-            self.services_cache.blockSignals(False)
-            self.config_cache.blockSignals(False)
-            self.states_individual_cache.blockSignals(False)
-            self.services_individual_cache.blockSignals(False)
+            del blockers
         except Exception as e:
             logger.error(f"Failed to load cache settings: {e}")
 
+    @pyqtSlot()
     def on_cache_changed(self):
         """Handle cache setting changes"""
         self.status_msg.setText("Settings changed - click Apply to save")
-        self.status_msg.setStyleSheet("color: #f48771; font-size: 10pt;")
+        set_label_state(self.status_msg, "bad")
 
+    @pyqtSlot()
     def apply_changes(self):
-        """Apply cache setting changes"""
-        try:
-            # Save settings
-            ui_config.set_cache_setting("states", self.states_cache.isChecked())
-            ui_config.set_cache_setting("services", self.services_cache.isChecked())
-            ui_config.set_cache_setting("config", self.config_cache.isChecked())
-            ui_config.set_cache_setting(
-                "states_individual", self.states_individual_cache.isChecked()
-            )
-            ui_config.set_cache_setting(
-                "services_individual", self.services_individual_cache.isChecked()
-            )
-
-            self.status_msg.setText(
-                "✓ Settings saved successfully - Restart service to apply"
+        """Apply cache setting changes (saved in one write on the thread pool)"""
+        self.apply_btn.setEnabled(False)
+        job = FunctionJob(
+            ui_config.update_cache_settings,
+            states=self.states_cache.isChecked(),
+            services=self.services_cache.isChecked(),
+            config=self.config_cache.isChecked(),
+            states_individual=self.states_individual_cache.isChecked(),
+            services_individual=self.services_individual_cache.isChecked(),
+        )
+        job.signals.result.connect(self._on_changes_applied, _UNIQUE)
+        QThreadPool.globalInstance().start(job)
+
+    @pyqtSlot(object)
+    def _on_changes_applied(self, saved: Optional[bool]):
+        """Report the result of saving cache settings"""
+        self.apply_btn.setEnabled(True)
+        if saved:
+            show_result(
+                self.status_msg,
+                True,
+                "Settings saved successfully - Restart service to apply",
             )
-            self.status_msg.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
-
-        except Exception as e:
-            logger.error(f"Failed to apply cache settings: {e}")
-            self.status_msg.setText(f"✗ Failed to save settings: {e}")
-            self.status_msg.setStyleSheet("color: #f48771; font-size: 10pt;")
+        else:
+            show_result(self.status_msg, False, "Failed to save settings - see ui.log")
 
 
 class StartupControlWidget(QWidget):
@@ -459,7 +632,7 @@ class StartupControlWidget(QWidget):
 
         # Run on login checkbox
         self.startup_checkbox = QCheckBox("Run on Windows Startup")
-        self.startup_checkbox.stateChanged.connect(self.on_startup_changed)
+        self.startup_checkbox.stateChanged.connect(self.on_startup_changed, _UNIQUE)
         startup_layout.addWidget(self.startup_checkbox)
 
         # Startup behavior dropdown
@@ -470,7 +643,9 @@ class StartupControlWidget(QWidget):
         self.behavior_combo.addItems(
             ["Minimized to Tray", "Show Window", "Show Window then Minimize"]
         )
-        self.behavior_combo.currentTextChanged.connect(self.on_behavior_changed)
+        self.behavior_combo.currentTextChanged.connect(
+            self.on_behavior_changed, _UNIQUE
+        )
         behavior_layout.addWidget(self.behavior_combo)
         behavior_layout.addStretch()
 
@@ -484,20 +659,33 @@ class StartupControlWidget(QWidget):
 
         # Clear logs on startup checkbox
         self.clear_logs_startup = QCheckBox("Clear logs on startup")
-        self.clear_logs_startup.stateChanged.connect(self.on_clear_logs_startup_changed)
+        self.clear_logs_startup.stateChanged.connect(
+            self.on_clear_logs_startup_changed, _UNIQUE
+        )
         log_layout.addWidget(self.clear_logs_startup)
 
         layout.addWidget(log_group)
 
         # Status message
         self.status_msg = QLabel("")
-        self.status_msg.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
+        set_label_state(self.status_msg, "ok")
         layout.addWidget(self.status_msg)
 
     def load_settings(self):
         """Load current startup settings"""
         try:
             settings = ui_config.get_all_settings()
+
+            # Block signals so loading doesn't toggle startup or re-save settings
+            blockers = [
+                QSignalBlocker(widget)
+                for widget in (
+                    self.startup_checkbox,
+                    self.behavior_combo,
+                    self.clear_logs_startup,
+                )
+            ]
+
             self.startup_checkbox.setChecked(settings.startup.run_on_login)
 
             behavior_map = {
@@ -512,26 +700,26 @@ class StartupControlWidget(QWidget):
 
             # Load log settings
             self.clear_logs_startup.setChecked(settings.logs.clear_on_startup)
+            del blockers
 
         except Exception as e:
             logger.error(f"Failed to load startup settings: {e}")
 
+    @pyqtSlot()
     def on_startup_changed(self):
         """Handle startup checkbox change"""
         try:
             enabled = self.startup_checkbox.isChecked()
             if self.startup_manager.toggle_startup():
                 status = "enabled" if enabled else "disabled"
-                self.status_msg.setText(f"✓ Startup {status} successfully")
-                self.status_msg.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
+                show_result(self.status_msg, True, f"Startup {status} successfully")
             else:
-                self.status_msg.setText("✗ Failed to toggle startup setting")
-                self.status_msg.setStyleSheet("color: #f48771; font-size: 10pt;")
+                show_result(self.status_msg, False, "Failed to toggle startup setting")
         except Exception as e:
             logger.error(f"Failed to toggle startup: {e}")
-            self.status_msg.setText(f"✗ Error: {e}")
-            self.status_msg.setStyleSheet("color: #f48771; font-size: 10pt;")
+            show_result(self.status_msg, False, f"Error: {e}")
 
+    @pyqtSlot()
     def on_behavior_changed(self):
         """Handle startup behavior change"""
         try:
@@ -543,14 +731,13 @@ class StartupControlWidget(QWidget):
             behavior = behavior_map.get(self.behavior_combo.currentText(), "minimized")
             ui_config.set_startup_setting("startup_behavior", behavior)
 
-            self.status_msg.setText("✓ Startup behavior updated")
-            self.status_msg.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
+            show_result(self.status_msg, True, "Startup behavior updated")
 
         except Exception as e:
             logger.error(f"Failed to update startup behavior: {e}")
-            self.status_msg.setText(f"✗ Error: {e}")
-            self.status_msg.setStyleSheet("color: #f48771; font-size: 10pt;")
+            show_result(self.status_msg, False, f"Error: {e}")
 
+    @pyqtSlot()
     def on_clear_logs_startup_changed(self):
         """Handle clear logs on startup checkbox change"""
         try:
@@ -558,36 +745,53 @@ class StartupControlWidget(QWidget):
             ui_config.set_log_setting("clear_on_startup", enabled)
 
             status = "enabled" if enabled else "disabled"
-            self.status_msg.setText(f"✓ Clear logs on startup {status}")
-            self.status_msg.setStyleSheet("color: #4ec9b0; font-size: 10pt;")
+            show_result(self.status_msg, True, f"Clear logs on startup {status}")
 
         except Exception as e:
             logger.error(f"Failed to update log setting: {e}")
-            self.status_msg.setText(f"✗ Error: {e}")
-            self.status_msg.setStyleSheet("color: #f48771; font-size: 10pt;")
+            show_result(self.status_msg, False, f"Error: {e}")
 
 
 class MainWindow(QMainWindow):
     """Main control window with dark theme"""
 
+    shown_once = pyqtSignal()  # first show, emitted once its paint is queued
+
     def __init__(
         self,
         service_controller: ServiceController,
         startup_manager: StartupManager,
         parent=None,
+        ticker: Optional[UITicker] = None,
     ):
         super().__init__(parent)
         self.service_controller = service_controller
         self.startup_manager = startup_manager
+        self._logs_inflight = False
+        self._has_shown = False
+
+        # One ticker drives every periodic refresh in this window
+        self.ticker = ticker if ticker is not None else UITicker(parent=self)
+
+        # Adaptive polling: back off while the log tail is unchanged
+        polling = ui_config.get_all_settings().polling
+        self._min_log_interval = polling.logs_interval
+        self._max_log_interval = polling.logs_max_interval
+        self._log_interval = self._min_log_interval
+        self._last_logs_hash = None
+        self._last_log_tick = self.ticker.count
+        ui_events.logs_received.connect(self._apply_logs)
+
+        # Coalesce move/resize bursts into a single settings write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_window_async, _UNIQUE)
 
         self.setup_ui()
-        self.setup_dark_theme()
         self.load_window_settings()
 
-        # Setup log refresh timer
-        self.log_timer = QTimer()
-        self.log_timer.timeout.connect(self.refresh_logs)
-        self.log_timer.start(5000)  # Refresh every 5 seconds
+        self.ticker.tick.connect(self._on_tick, _UNIQUE)
 
     def setup_ui(self):
         """Setup the main UI"""
@@ -636,7 +840,7 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout(left_panel)
 
         # Service status widget
-        self.service_widget = ServiceStatusWidget(self.service_controller)
+        self.service_widget = ServiceStatusWidget(self.service_controller, self.ticker)
         left_layout.addWidget(self.service_widget)
 
         # Cache control widget
@@ -662,11 +866,11 @@ class MainWindow(QMainWindow):
 
         self.auto_refresh = QCheckBox("Auto-refresh")
         self.auto_refresh.setChecked(True)
-        self.auto_refresh.stateChanged.connect(self.toggle_auto_refresh)
+        self.auto_refresh.stateChanged.connect(self.toggle_auto_refresh, _UNIQUE)
         log_controls.addWidget(self.auto_refresh)
 
         self.clear_logs_btn = QPushButton("Clear Logs")
-        self.clear_logs_btn.clicked.connect(self.clear_logs)
+        self.clear_logs_btn.clicked.connect(self.clear_logs, _UNIQUE)
         log_controls.addWidget(self.clear_logs_btn)
 
         log_controls.addStretch()
@@ -693,121 +897,13 @@ class MainWindow(QMainWindow):
         # Metrics Dashboard Tab
         self.metrics_panel = MetricsPanel()
         self.tab_widget.addTab(self.metrics_panel, "Metrics Dashboard")
+        QApplication.instance().aboutToQuit.connect(self.metrics_panel.shutdown)
 
         main_layout.addWidget(self.tab_widget)
 
         # Load initial logs
         self.refresh_logs()
 
-    def setup_dark_theme(self):
-        """Apply dark theme styling"""
-        self.setStyleSheet(
-            """
-            QMainWindow {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #007acc;
-            }
-            
-            QPushButton {
-                background-color: #404040;
-                color: #e0e0e0;
-                border: 1px solid #606060;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #707070;
-            }
-            
-            QPushButton:pressed {
-                background-color: #303030;
-            }
-            
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #808080;
-                border-color: #404040;
-            }
-            
-            QCheckBox {
-                color: #e0e0e0;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #606060;
-                background-color: #2d2d2d;
-                border-radius: 3px;
-            }
-            
-            QCheckBox::indicator:checked {
-                border: 2px solid #007acc;
-                background-color: #007acc;
-                border-radius: 3px;
-            }
-            
-            QComboBox {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #606060;
-                border-radius: 4px;
-                padding: 4px 8px;
-                min-width: 120px;
-            }
-            
-            QComboBox:hover {
-                border-color: #707070;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #e0e0e0;
-                margin-right: 5px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #606060;
-                selection-background-color: #007acc;
-            }
-            
-            QLabel {
-                color: #e0e0e0;
-            }
-        """
-        )
-
     def load_window_settings(self):
         """Load window position and size from settings"""
         try:
@@ -818,41 +914,113 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Failed to load window settings: {e}")
 
+    def _window_geometry(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Get the current window position and size"""
+        return (
+            (self.pos().x(), self.pos().y()),
+            (self.size().width(), self.size().height()),
+        )
+
     def save_window_settings(self):
         """Save window position and size to settings"""
+        self._save_timer.stop()
         try:
-            ui_config.update_window_settings(
-                (self.pos().x(), self.pos().y()),
-                (self.size().width(), self.size().height()),
-            )
+            ui_config.update_window_settings(*self._window_geometry())
         except Exception as e:
             logger.error(f"Failed to save window settings: {e}")
 
+    @pyqtSlot()
+    def _save_window_async(self):
+        """Save window position and size on the thread pool"""
+        job = FunctionJob(ui_config.update_window_settings, *self._window_geometry())
+        QThreadPool.globalInstance().start(job)
+
+    def moveEvent(self, event):
+        """Schedule a debounced settings save when the window moves"""
+        super().moveEvent(event)
+        self._save_timer.start()
+
+    def resizeEvent(self, event):
+        """Schedule a debounced settings save when the window is resized"""
+        super().resizeEvent(event)
+        self._save_timer.start()
+
+    @pyqtSlot()
     def refresh_logs(self):
+        """Request the latest service logs from the thread pool"""
+        # Skip the tick if the previous read hasn't completed yet
+        if self._logs_inflight:
+            return
+
+        self._logs_inflight = True
+        worker = LogsWorker(self.service_controller, 50)  # Last 50 lines
+        worker.signals.result.connect(self._on_logs_result, _UNIQUE)
+        QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(object)
+    def _on_logs_result(self, logs: List[str]):
+        """Publish a worker's log tail on the UI event bus"""
+        self._logs_inflight = False
+        ui_events.logs_received.emit(logs)
+
+    def _apply_logs(self, logs: List[str]):
         """Refresh the log viewer"""
         try:
-            logs = self.service_controller.get_service_logs(50)  # Last 50 lines
             if logs:
-                # Clear and add new logs
-                self.log_viewer.clear()
-                for log in logs:
-                    self.log_viewer.append_log(log)
+                self.log_viewer.update_logs(logs)
+            self._adjust_log_interval(hash(tuple(logs)))
         except Exception as e:
             logger.error(f"Failed to refresh logs: {e}")
 
+    def _adjust_log_interval(self, logs_hash: int):
+        """Double the log refresh interval while logs are idle, reset on change"""
+        if logs_hash == self._last_logs_hash:
+            self._log_interval = min(self._log_interval * 2, self._max_log_interval)
+        else:
+            self._log_interval = self._min_log_interval
+        self._last_logs_hash = logs_hash
+
+    @pyqtSlot(int)
+    def _on_tick(self, tick: int):
+        """Refresh logs once the current interval has elapsed"""
+        if not self.auto_refresh.isChecked():
+            return
+        if tick - self._last_log_tick >= ms_to_ticks(self._log_interval):
+            self._last_log_tick = tick
+            self.refresh_logs()
+
+    @pyqtSlot()
     def toggle_auto_refresh(self):
-        """Toggle auto-refresh of logs"""
+        """Toggle auto-refresh of logs (ticks are ignored while unchecked)"""
         if self.auto_refresh.isChecked():
-            self.log_timer.start(5000)
-        else:
-            self.log_timer.stop()
+            # Restart at the fastest interval with an immediate refresh
+            self._log_interval = self._min_log_interval
+            self._last_log_tick = self.ticker.count
+            self.refresh_logs()
 
+    @pyqtSlot()
     def clear_logs(self):
         """Clear service logs"""
         if self.service_controller.clear_logs():
             self.log_viewer.clear_logs()
 
+    def showEvent(self, event):
+        """Resume the dashboard and announce the first show"""
+        super().showEvent(event)
+        self.metrics_panel.resume()
+        if not self._has_shown:
+            self._has_shown = True
+            # Deferred so the first paint goes out first, and so listeners
+            # connected right after show() still hear it
+            QTimer.singleShot(0, self.shown_once.emit)
+
+    def hideEvent(self, event):
+        """Pause the dashboard's fetches while the window is hidden"""
+        super().hideEvent(event)
+        self.metrics_panel.pause()
+
     def closeEvent(self, event):
         """Handle window close event"""
         self.save_window_settings()
+        self.metrics_panel.shutdown()
         event.accept()
@@ -3,12 +3,17 @@ Metrics Dashboard Panel for HA Bridge Control UI
 Real-time monitoring of service performance, health, and statistics
 """
 
+import asyncio
 import json
 import time
 import logging
+import os
+import re
+import threading
+from bisect import bisect_right
+from concurrent.futures import Future
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import deque
 
 import httpx
 import numpy as np
@@ -28,114 +33,285 @@ from PyQt6.QtWidgets import (
     QTextEdit,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.animation import FuncAnimation
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 
 from app.config.ui_config import ui_config
 
 logger = logging.getLogger(__name__)
 
-
-class MetricsDataFetcher(QThread):
-    """Background thread for fetching metrics data"""
+# Label stylesheets per severity level, built once instead of on every update
+_LEVEL_CSS = {
+    "good": "color: #4CAF50;",
+    "warning": "color: #FF9800;",
+    "critical": "color: #F44336;",
+}
+_LEVEL_CSS_BOLD = {
+    level: f"{css} font-weight: bold;" for level, css in _LEVEL_CSS.items()
+}
+_LEVEL_CSS_ICON = {
+    level: f"{css} font-weight: bold; font-size: 18px;"
+    for level, css in _LEVEL_CSS.items()
+}
+_HEALTH_LEVELS = {"healthy": "good", "warning": "warning"}
+# Status label text and stylesheet per level
+_LEVEL_STATUS = {
+    level: (level.title(), css) for level, css in _LEVEL_CSS_BOLD.items()
+}
+
+
+# Severity thresholds, ascending, and the level for each bucket between them
+_LOWER_IS_BETTER = ("good", "warning", "critical")
+_HIGHER_IS_BETTER = ("critical", "warning", "good")
+_SCORE_BINS = (60, 80)  # health score, stability and cache hit rate (%)
+_RESPONSE_TIME_BINS = (2, 5)  # seconds
+_ERROR_PERCENT_BINS = (5, 10)  # %
+_ERROR_RATIO_BINS = (0.05, 0.1)  # fraction of requests
+
+
+def _level(value: float, bins: Tuple[float, float], levels: Tuple[str, ...]) -> str:
+    """Severity level of a value, by which threshold bucket it falls in"""
+    return levels[bisect_right(bins, value)]
+
+
+class MetricsDataFetcher(QObject):
+    """Fetches metrics data on a background asyncio loop
+
+    Each call to fetch() schedules one request round on the loop; results are
+    delivered through Qt signals, which queue them onto the UI thread.
+    """
 
     data_updated = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
 
+    # Only these samples are read by the health score, charts and labels
+    WANTED = frozenset(
+        (
+            "ha_bridge_requests_total",
+            "ha_bridge_errors_total",
+            "ha_bridge_request_duration_seconds_sum",
+            "ha_bridge_request_duration_seconds_count",
+            "ha_bridge_cache_hits_total",
+            "ha_bridge_cache_misses_total",
+        )
+    )
+    # Root shared by every wanted name, checked before a line is sliced
+    WANTED_PREFIX = os.path.commonprefix(sorted(WANTED))
+    # Any sample line: name, optional {labels} (which may contain braces), value
+    SAMPLE_PATTERN = re.compile(
+        rb"^([A-Za-z_:][\w:]*)(?:\{.*\})?[ \t]+(\S+)", re.MULTILINE
+    )
+
     def __init__(
         self,
         base_url: str = "http://127.0.0.1:8000",
         api_key: str = "test-api-key-12345",
+        all_metrics: bool = False,
+        parent=None,
     ):
-        super().__init__()
+        super().__init__(parent)
         self.base_url = base_url
         self.api_key = api_key
         self.headers = {"Authorization": f"Bearer {api_key}"}
-        self.running = False
+        # Collect every exported sample instead of just WANTED (for debugging)
+        self.all_metrics = all_metrics
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._pending: Optional[Future] = None
+        # Prefer the service's JSON totals; fall back to parsing /metrics
+        self._metrics_path = "/metrics" if all_metrics else "/metrics.json"
+        # Previous (value, monotonic time) for each counter, for rate math
+        self._prev_counters: Dict[str, Tuple[float, float]] = {}
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a keep-alive client shared by every fetch"""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
 
-    def run(self):
-        """Main thread loop"""
-        self.running = True
-        while self.running:
-            try:
-                self.fetch_metrics()
-                self.msleep(5000)  # Update every 5 seconds
-            except Exception as e:
-                logger.error(f"Error fetching metrics: {e}")
-                self.error_occurred.emit(str(e))
-                self.msleep(10000)  # Wait longer on error
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="metrics-fetcher", daemon=True
+            )
+            self._loop_thread.start()
+        return self._loop
+
+    def fetch(self):
+        """Schedule a single fetch (ignored while one is still in flight)"""
+        if self._pending is not None and not self._pending.done():
+            return
+
+        self._pending = asyncio.run_coroutine_threadsafe(
+            self._fetch_metrics_async(), self._ensure_loop()
+        )
+
+    async def _close_client(self):
+        """Close the HTTP client on the loop that owns it"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def stop(self):
-        """Stop the thread"""
-        self.running = False
-        self.wait()
+        """Cancel any in-flight fetch, close the client and stop the loop"""
+        if self._loop is None:
+            return
+
+        # Cancelling interrupts the request instead of waiting out its timeout
+        if self._pending is not None:
+            self._pending.cancel()
 
-    def fetch_metrics(self):
-        """Fetch metrics from the service"""
         try:
-            with httpx.Client(timeout=10.0) as client:
-                # Fetch status data (use health endpoint since status doesn't exist)
-                status_response = client.get(
-                    f"{self.base_url}/health", headers=self.headers
-                )
-                status_data = (
-                    status_response.json() if status_response.status_code == 200 else {}
-                )
+            asyncio.run_coroutine_threadsafe(self._close_client(), self._loop).result(
+                timeout=5.0
+            )
+        except Exception as e:
+            logger.error(f"Error stopping metrics fetcher: {e}")
 
-                # Fetch metrics data (Prometheus format)
-                metrics_response = client.get(f"{self.base_url}/metrics")
-                metrics_data = (
-                    self.parse_prometheus_metrics(metrics_response.text)
-                    if metrics_response.status_code == 200
-                    else {}
-                )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+        self._pending = None
 
-                # Combine data
-                combined_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "status": status_data,
-                    "metrics": metrics_data,
-                    "service_health": self.calculate_service_health(
-                        status_data, metrics_data
-                    ),
-                }
+    async def _fetch_metrics_async(self):
+        """Fetch status and metrics from the service concurrently"""
+        try:
+            if self._client is None:
+                self._client = self._create_client()
+
+            # Status comes from the health endpoint since status doesn't exist
+            status_response, metrics_response = await asyncio.gather(
+                self._client.get("/health"), self._client.get(self._metrics_path)
+            )
+            if (
+                metrics_response.status_code == 404
+                and self._metrics_path == "/metrics.json"
+            ):
+                # Older service without the JSON summary: parse Prometheus text
+                self._metrics_path = "/metrics"
+                metrics_response = await self._client.get(self._metrics_path)
+
+            status_data = (
+                status_response.json() if status_response.status_code == 200 else {}
+            )
+            if metrics_response.status_code != 200:
+                metrics_data = {}
+            elif self._metrics_path == "/metrics.json":
+                metrics_data = metrics_response.json()
+            elif self.all_metrics:
+                metrics_data = self.parse_all_prometheus_metrics(
+                    metrics_response.content
+                )
+                logger.debug(f"Fetched {len(metrics_data)} metrics")
+            else:
+                metrics_data = self.parse_prometheus_metrics(metrics_response.text)
+            self.add_average_duration(metrics_data)
+
+            # Combine data
+            combined_data = {
+                "timestamp": datetime.now(),
+                "status": status_data,
+                "metrics": metrics_data,
+                "rates": self.calculate_rates(metrics_data),
+                "service_health": self.calculate_service_health(
+                    status_data, metrics_data
+                ),
+            }
 
-                self.data_updated.emit(combined_data)
+            self.data_updated.emit(combined_data)
 
         except Exception as e:
             logger.error(f"Failed to fetch metrics: {e}")
             self.error_occurred.emit(str(e))
 
+    def calculate_rates(self, metrics_data: Dict[str, Any]) -> Dict[str, float]:
+        """Convert counter totals to per-minute rates since the previous fetch"""
+        now = time.monotonic()
+        rates = {}
+
+        for name, value in metrics_data.items():
+            if not name.endswith("_total"):
+                continue
+
+            prev = self._prev_counters.get(name)
+            if prev is not None and now > prev[1]:
+                # A counter that went backwards means the service restarted
+                rates[name] = max(0.0, (value - prev[0]) / (now - prev[1]) * 60)
+            else:
+                rates[name] = 0.0
+            self._prev_counters[name] = (value, now)
+
+        return rates
+
     def parse_prometheus_metrics(self, metrics_text: str) -> Dict[str, Any]:
-        """Parse Prometheus metrics format"""
+        """Parse the wanted Prometheus metrics, summing samples across labels"""
+        _float = float
+        wanted = self.WANTED
+        prefix = self.WANTED_PREFIX
+        remaining = set(wanted)
         metrics = {}
-        lines = metrics_text.strip().split("\n")
 
-        for line in lines:
-            if line.startswith("#") or not line.strip():
+        for line in metrics_text.splitlines():
+            if not line:
+                continue
+            if line[0] == "#":
+                # Each family starts with a HELP line, so once every wanted
+                # metric has been seen the rest of the exposition can be skipped
+                if not remaining and line.startswith("# HELP"):
+                    break
+                continue
+            if not line.startswith(prefix):
                 continue
 
-            try:
-                # Parse metric line: metric_name{labels} value
-                if "{" in line:
-                    metric_part, value_part = line.rsplit(" ", 1)
-                    metric_name = metric_part.split("{")[0]
-                    value = float(value_part)
-                    metrics[metric_name] = value
-                else:
-                    parts = line.split(" ")
-                    if len(parts) == 2:
-                        metric_name, value = parts[0], float(parts[1])
-                        metrics[metric_name] = value
-            except (ValueError, IndexError):
+            # Metric line: metric_name{labels} value (labels are optional)
+            sp = line.rfind(" ")
+            if sp <= 0:
                 continue
+            brace = line.find("{")
+            name = line[:brace] if 0 < brace < sp else line[:sp].rstrip()
+            if name not in wanted:
+                continue
+
+            metrics[name] = metrics.get(name, 0.0) + _float(line[sp + 1 :])
+            remaining.discard(name)
 
         return metrics
 
+    def parse_all_prometheus_metrics(self, content: bytes) -> Dict[str, Any]:
+        """Parse every Prometheus sample, summing samples across labels
+
+        Works on the raw response bytes so the exposition is never decoded
+        as a whole; only metric names are.
+        """
+        metrics = {}
+        for match in self.SAMPLE_PATTERN.finditer(content):
+            name = match.group(1).decode("ascii")
+            metrics[name] = metrics.get(name, 0.0) + float(match.group(2))
+        return metrics
+
+    @staticmethod
+    def add_average_duration(metrics: Dict[str, Any]):
+        """Derive the average request duration from the histogram totals"""
+        duration_count = metrics.get("ha_bridge_request_duration_seconds_count", 0)
+        if duration_count:
+            metrics["ha_bridge_request_duration_seconds"] = (
+                metrics.get("ha_bridge_request_duration_seconds_sum", 0)
+                / duration_count
+            )
+
     def calculate_service_health(
         self, status_data: Dict, metrics_data: Dict
     ) -> Dict[str, Any]:
@@ -149,7 +325,7 @@ class MetricsDataFetcher(QThread):
             issues.append("Home Assistant disconnected")
 
         # Check WebSocket status
-        ws_status = status_data.get("websocket", {})
+        ws_status = status_data.get("websocket") or {}
         if not ws_status.get("connected", False):
             health_score -= 20
             issues.append("WebSocket disconnected")
@@ -187,8 +363,35 @@ class MetricsDataFetcher(QThread):
         }
 
 
+# Title, y-axis label and line color for each chart type
+CHART_STYLES = {
+    "response_time": ("Response Time (seconds)", "Seconds", "#4CAF50"),
+    "request_rate": ("Request Rate (per minute)", "Requests/min", "#2196F3"),
+    "error_rate": ("Error Rate (%)", "Error %", "#F44336"),
+    "cache_hit_rate": ("Cache Hit Rate (%)", "Hit %", "#9C27B0"),
+}
+
+
+def _decimate(
+    x: np.ndarray, y: np.ndarray, max_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stride-sample a series down to at most max_points, keeping the newest"""
+    step = max(1, -(-len(x) // max(1, max_points)))
+    if step == 1:
+        return x, y
+    start = (len(x) - 1) % step
+    return x[start::step], y[start::step]
+
+
 class MetricsChart(FigureCanvas):
-    """Custom matplotlib chart widget"""
+    """Custom matplotlib chart widget
+
+    Lines and reference lines are created once and updated in place with
+    set_data; switching chart type only toggles which artists are visible.
+    """
+
+    # Keep last 60 data points (5 minutes at 5s intervals)
+    HISTORY_SIZE = 60
 
     def __init__(self, parent=None, width=5, height=4, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
@@ -204,154 +407,158 @@ class MetricsChart(FigureCanvas):
         self.axes.spines["top"].set_color("white")
         self.axes.spines["right"].set_color("white")
         self.axes.spines["left"].set_color("white")
+        self.axes.grid(True, alpha=0.3)
+        self.axes.xaxis_date()
+
+        # Data storage: preallocated ring buffers, one series per chart type
+        # sharing the timestamps (matplotlib date numbers). Every sample is
+        # written twice, HISTORY_SIZE apart, so the last HISTORY_SIZE samples
+        # are always one contiguous slice and can be plotted without copying.
+        self._timestamps = np.zeros(2 * self.HISTORY_SIZE)
+        self._series = {
+            chart_type: np.zeros(2 * self.HISTORY_SIZE) for chart_type in CHART_STYLES
+        }
+        self._head = 0  # next slot to write
+        self._count = 0  # number of filled slots
+
+        # Persistent artists
+        self._lines = {}
+        for chart_type, (_, _, color) in CHART_STYLES.items():
+            (self._lines[chart_type],) = self.axes.plot(
+                [], [], color=color, linewidth=2, marker="o", markersize=3
+            )
+        self._avg_line = self.axes.axhline(
+            y=0, color="#FF9800", linestyle="--", alpha=0.7
+        )
+        self._reference_lines = {
+            "response_time": [self._avg_line],
+            "request_rate": [],
+            "error_rate": [
+                self.axes.axhline(
+                    y=5,
+                    color="#FF9800",
+                    linestyle="--",
+                    alpha=0.7,
+                    label="Warning (5%)",
+                ),
+                self.axes.axhline(
+                    y=10,
+                    color="#F44336",
+                    linestyle="--",
+                    alpha=0.7,
+                    label="Critical (10%)",
+                ),
+            ],
+            "cache_hit_rate": [
+                self.axes.axhline(
+                    y=80,
+                    color="#4CAF50",
+                    linestyle="--",
+                    alpha=0.7,
+                    label="Target (80%)",
+                )
+            ],
+        }
 
-        # Data storage
-        self.data_points = deque(
-            maxlen=60
-        )  # Keep last 60 data points (5 minutes at 5s intervals)
-        self.timestamps = deque(maxlen=60)
+        self.chart_type = None
+        self.set_chart_type("response_time")
 
-    def update_chart(self, data: Dict[str, Any], chart_type: str = "response_time"):
-        """Update chart with new data"""
-        self.axes.clear()
+    def set_chart_type(self, chart_type: str):
+        """Show only the artists belonging to the given chart type"""
+        if chart_type == self.chart_type or chart_type not in CHART_STYLES:
+            return
 
-        if chart_type == "response_time":
-            self._plot_response_time(data)
-        elif chart_type == "request_rate":
-            self._plot_request_rate(data)
-        elif chart_type == "error_rate":
-            self._plot_error_rate(data)
-        elif chart_type == "cache_hit_rate":
-            self._plot_cache_hit_rate(data)
+        self.chart_type = chart_type
+        for other_type, line in self._lines.items():
+            line.set_visible(other_type == chart_type)
+            for reference_line in self._reference_lines[other_type]:
+                reference_line.set_visible(other_type == chart_type)
 
+        title, ylabel, _ = CHART_STYLES[chart_type]
+        self.axes.set_title(title, color="white", fontsize=12)
+        self.axes.set_ylabel(ylabel, color="white")
+        self._refresh()
         self.fig.tight_layout()
-        self.draw()
 
-    def _plot_response_time(self, data: Dict[str, Any]):
-        """Plot response time over time"""
-        metrics = data.get("metrics", {})
-        response_time = metrics.get("ha_bridge_request_duration_seconds", 0)
-
-        self.data_points.append(response_time)
-        self.timestamps.append(datetime.now())
+    def show_chart(self, chart_type: str):
+        """Switch chart type and redraw straight away"""
+        self.set_chart_type(chart_type)
+        self.draw_idle()
 
-        if len(self.data_points) > 1:
-            times = list(self.timestamps)
-            values = list(self.data_points)
-
-            self.axes.plot(
-                times, values, color="#4CAF50", linewidth=2, marker="o", markersize=3
-            )
-            self.axes.set_title("Response Time (seconds)", color="white", fontsize=12)
-            self.axes.set_ylabel("Seconds", color="white")
-            self.axes.grid(True, alpha=0.3)
-
-            # Add average line
-            avg_time = np.mean(values)
-            self.axes.axhline(
-                y=avg_time,
-                color="#FF9800",
-                linestyle="--",
-                alpha=0.7,
-                label=f"Avg: {avg_time:.2f}s",
-            )
-            self.axes.legend()
+    def update_chart(self, data: Dict[str, Any], chart_type: str = "response_time"):
+        """Update chart with new data"""
+        self._record(data)
+        self.set_chart_type(chart_type)
+        self._refresh()
+        self.draw_idle()
 
-    def _plot_request_rate(self, data: Dict[str, Any]):
-        """Plot request rate over time"""
+    def _record(self, data: Dict[str, Any]):
+        """Append this tick's value for every chart type"""
         metrics = data.get("metrics", {})
-        total_requests = metrics.get("ha_bridge_requests_total", 0)
-
-        # Calculate requests per minute
-        current_time = datetime.now()
-        if len(self.timestamps) > 0:
-            time_diff = (current_time - self.timestamps[-1]).total_seconds()
-            if time_diff > 0:
-                requests_per_minute = (
-                    total_requests - getattr(self, "_last_total_requests", 0)
-                ) * (60 / time_diff)
-            else:
-                requests_per_minute = 0
-        else:
-            requests_per_minute = 0
-
-        self._last_total_requests = total_requests
-        self.data_points.append(requests_per_minute)
-        self.timestamps.append(current_time)
+        current_time = mdates.date2num(data.get("timestamp") or datetime.now())
 
-        if len(self.data_points) > 1:
-            times = list(self.timestamps)
-            values = list(self.data_points)
-
-            self.axes.plot(
-                times, values, color="#2196F3", linewidth=2, marker="o", markersize=3
-            )
-            self.axes.set_title("Request Rate (per minute)", color="white", fontsize=12)
-            self.axes.set_ylabel("Requests/min", color="white")
-            self.axes.grid(True, alpha=0.3)
+        # Response time
+        response_time = metrics.get("ha_bridge_request_duration_seconds", 0)
 
-    def _plot_error_rate(self, data: Dict[str, Any]):
-        """Plot error rate over time"""
-        metrics = data.get("metrics", {})
+        # Requests per minute (derived by the fetcher)
         total_requests = metrics.get("ha_bridge_requests_total", 0)
-        error_requests = metrics.get("ha_bridge_errors_total", 0)
+        requests_per_minute = data.get("rates", {}).get("ha_bridge_requests_total", 0)
 
+        # Error rate
+        error_requests = metrics.get("ha_bridge_errors_total", 0)
         error_rate = 0
         if total_requests > 0:
             error_rate = (error_requests / total_requests) * 100
 
-        self.data_points.append(error_rate)
-        self.timestamps.append(datetime.now())
-
-        if len(self.data_points) > 1:
-            times = list(self.timestamps)
-            values = list(self.data_points)
-
-            self.axes.plot(
-                times, values, color="#F44336", linewidth=2, marker="o", markersize=3
-            )
-            self.axes.set_title("Error Rate (%)", color="white", fontsize=12)
-            self.axes.set_ylabel("Error %", color="white")
-            self.axes.grid(True, alpha=0.3)
-
-            # Add warning lines
-            self.axes.axhline(
-                y=5, color="#FF9800", linestyle="--", alpha=0.7, label="Warning (5%)"
-            )
-            self.axes.axhline(
-                y=10, color="#F44336", linestyle="--", alpha=0.7, label="Critical (10%)"
-            )
-            self.axes.legend()
-
-    def _plot_cache_hit_rate(self, data: Dict[str, Any]):
-        """Plot cache hit rate over time"""
-        metrics = data.get("metrics", {})
+        # Cache hit rate
         cache_hits = metrics.get("ha_bridge_cache_hits_total", 0)
         cache_misses = metrics.get("ha_bridge_cache_misses_total", 0)
-
         hit_rate = 0
         if cache_hits + cache_misses > 0:
             hit_rate = (cache_hits / (cache_hits + cache_misses)) * 100
 
-        self.data_points.append(hit_rate)
-        self.timestamps.append(datetime.now())
+        slots = [self._head, self._head + self.HISTORY_SIZE]
+        self._timestamps[slots] = current_time
+        self._series["response_time"][slots] = response_time
+        self._series["request_rate"][slots] = requests_per_minute
+        self._series["error_rate"][slots] = error_rate
+        self._series["cache_hit_rate"][slots] = hit_rate
+        self._head = (self._head + 1) % self.HISTORY_SIZE
+        self._count = min(self.HISTORY_SIZE, self._count + 1)
+
+    def _ordered(self, buffer: np.ndarray) -> np.ndarray:
+        """Get a view of a ring buffer's filled slots, oldest first"""
+        if self._count < self.HISTORY_SIZE:
+            return buffer[: self._count]
+        return buffer[self._head : self._head + self.HISTORY_SIZE]
+
+    def _refresh(self):
+        """Push the visible series into its line and rescale the axes"""
+        if self._count < 2:
+            return
+
+        values = self._ordered(self._series[self.chart_type])
+
+        # Never draw more points than the axes are pixels wide
+        self._lines[self.chart_type].set_data(
+            *_decimate(
+                self._ordered(self._timestamps), values, int(self.axes.bbox.width)
+            )
+        )
 
-        if len(self.data_points) > 1:
-            times = list(self.timestamps)
-            values = list(self.data_points)
+        if self.chart_type == "response_time":
+            avg_time = values.mean()
+            self._avg_line.set_ydata([avg_time, avg_time])
+            self._avg_line.set_label(f"Avg: {avg_time:.2f}s")
 
-            self.axes.plot(
-                times, values, color="#9C27B0", linewidth=2, marker="o", markersize=3
-            )
-            self.axes.set_title("Cache Hit Rate (%)", color="white", fontsize=12)
-            self.axes.set_ylabel("Hit %", color="white")
-            self.axes.grid(True, alpha=0.3)
+        reference_lines = self._reference_lines[self.chart_type]
+        if reference_lines:
+            self.axes.legend(handles=reference_lines)
+        elif self.axes.get_legend() is not None:
+            self.axes.get_legend().remove()
 
-            # Add target line
-            self.axes.axhline(
-                y=80, color="#4CAF50", linestyle="--", alpha=0.7, label="Target (80%)"
-            )
-            self.axes.legend()
+        self.axes.relim(visible_only=True)
+        self.axes.autoscale_view()
 
 
 class MetricsPanel(QWidget):
@@ -359,6 +566,13 @@ class MetricsPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_signature: Optional[str] = None
+        self._last_errors_text = ""
+        # Stylesheet last applied to each label, so unchanged states skip Qt
+        self._last_style: Dict[QWidget, str] = {}
+        # Newest payload waiting for the next _flush, and whether one is queued
+        self._pending_data: Optional[Dict[str, Any]] = None
+        self._flush_pending = False
         self.setup_ui()
         self.setup_data_fetcher()
         self.setup_timer()
@@ -380,7 +594,7 @@ class MetricsPanel(QWidget):
         # Auto-refresh toggle
         self.auto_refresh_cb = QCheckBox("Auto-refresh")
         self.auto_refresh_cb.setChecked(True)
-        self.auto_refresh_cb.stateChanged.connect(self.toggle_auto_refresh)
+        self.auto_refresh_cb.toggled.connect(self.toggle_auto_refresh)
         header_layout.addWidget(self.auto_refresh_cb)
 
         # Refresh button
@@ -491,9 +705,9 @@ class MetricsPanel(QWidget):
 
         # Uptime and stability metrics
         layout.addWidget(QLabel("Service Uptime:"), 0, 0)
-        self.uptime_label = QLabel("Calculating...")
-        self.uptime_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
-        layout.addWidget(self.uptime_label, 0, 1)
+        self.prod_uptime_label = QLabel("Calculating...")
+        self.prod_uptime_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+        layout.addWidget(self.prod_uptime_label, 0, 1)
 
         layout.addWidget(QLabel("Stability Score:"), 0, 2)
         self.stability_label = QLabel("Calculating...")
@@ -580,10 +794,10 @@ class MetricsPanel(QWidget):
         layout.addWidget(self.total_requests_label, 4, 1)
 
         # Uptime
-        self.uptime_label = QLabel("Unknown")
-        self.uptime_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self.metric_uptime_label = QLabel("Unknown")
+        self.metric_uptime_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
         layout.addWidget(QLabel("Uptime:"), 5, 0)
-        layout.addWidget(self.uptime_label, 5, 1)
+        layout.addWidget(self.metric_uptime_label, 5, 1)
 
         return group
 
@@ -614,127 +828,185 @@ class MetricsPanel(QWidget):
         return group
 
     def setup_data_fetcher(self):
-        """Setup the data fetcher thread"""
-        self.data_fetcher = MetricsDataFetcher()
+        """Setup the background data fetcher"""
+        self.data_fetcher = MetricsDataFetcher(
+            all_metrics=logger.isEnabledFor(logging.DEBUG), parent=self
+        )
         self.data_fetcher.data_updated.connect(self.update_metrics)
         self.data_fetcher.error_occurred.connect(self.handle_error)
 
     def setup_timer(self):
-        """Setup refresh timer"""
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_data)
+        """Setup refresh timer (the only thing that drives periodic fetches)"""
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(5000)  # 5 seconds
+        self.refresh_timer.timeout.connect(self.data_fetcher.fetch)
+        self.toggle_auto_refresh(self.auto_refresh_cb.isChecked())
 
     def toggle_auto_refresh(self, checked: bool):
         """Toggle auto-refresh"""
         if checked:
-            self.refresh_timer.start(5000)  # 5 seconds
-            self.data_fetcher.start()
+            self.refresh_timer.start()
+            self.data_fetcher.fetch()
         else:
             self.refresh_timer.stop()
-            self.data_fetcher.stop()
 
     def manual_refresh(self):
         """Manual refresh"""
-        if not self.data_fetcher.isRunning():
-            self.data_fetcher.start()
-
-    def refresh_data(self):
-        """Refresh data if auto-refresh is enabled"""
-        if self.auto_refresh_cb.isChecked() and not self.data_fetcher.isRunning():
-            self.data_fetcher.start()
+        self.data_fetcher.fetch()
+        # Restart the countdown so the next automatic fetch isn't right behind
+        if self.refresh_timer.isActive():
+            self.refresh_timer.start()
 
     @pyqtSlot(dict)
     def update_metrics(self, data: Dict[str, Any]):
         """Update metrics display with new data"""
         try:
-            # Update health overview
-            health = data.get("service_health", {})
-            score = health.get("score", 0)
-            status = health.get("status", "unknown")
-            issues = health.get("issues", [])
-
-            self.health_score_label.setText(str(score))
-            self.health_score_label.setStyleSheet(
-                f"color: {'#4CAF50' if score >= 80 else '#FF9800' if score >= 60 else '#F44336'};"
-            )
+            # Update last update time (stamped once by the fetcher)
+            fetched_at = data.get("timestamp") or datetime.now()
+            self.last_update_label.setText(fetched_at.strftime("%H:%M:%S"))
 
-            self.health_status_label.setText(status.title())
-            self.health_status_label.setStyleSheet(
-                f"color: {'#4CAF50' if status == 'healthy' else '#FF9800' if status == 'warning' else '#F44336'};"
-            )
+            # Update chart (its time axis advances even when values don't)
+            chart_type = self.chart_type_combo.currentText().lower().replace(" ", "_")
+            self.main_chart.update_chart(data, chart_type)
 
-            # Update connection status
-            status_data = data.get("status", {})
+            # Coalesce label updates: apply only the newest payload, once a frame
+            self._pending_data = data
+            if not self._flush_pending:
+                self._flush_pending = True
+                QTimer.singleShot(16, self._flush)
 
-            ha_connected = status_data.get("ha_connected", False)
-            self.ha_connection_label.setText(
-                "Connected" if ha_connected else "Disconnected"
-            )
-            self.ha_connection_label.setStyleSheet(
-                "color: #4CAF50;" if ha_connected else "color: #F44336;"
-            )
+        except Exception as e:
+            logger.error(f"Error updating metrics: {e}")
 
-            ws_status = status_data.get("websocket", {})
-            ws_connected = ws_status.get("connected", False)
-            self.ws_status_label.setText(
-                "Connected" if ws_connected else "Disconnected"
-            )
-            self.ws_status_label.setStyleSheet(
-                "color: #4CAF50;" if ws_connected else "color: #F44336;"
-            )
+    @pyqtSlot()
+    def _flush(self):
+        """Apply the newest pending payload to the labels"""
+        self._flush_pending = False
+        data, self._pending_data = self._pending_data, None
+        if data is None:
+            return
 
-            # Update last update time
-            self.last_update_label.setText(datetime.now().strftime("%H:%M:%S"))
+        try:
+            # Nothing else to repaint on an idle tick
+            signature = self._payload_signature(data)
+            if signature == self._last_signature:
+                return
 
-            # Update production monitoring
-            self.update_production_monitoring(data)
+            # Batch every label change into a single repaint
+            self.setUpdatesEnabled(False)
+            try:
+                self.update_labels(data)
+            finally:
+                self.setUpdatesEnabled(True)
 
-            # Update metrics
-            metrics = data.get("metrics", {})
+            # Recorded only once applied, so a failed update is retried
+            self._last_signature = signature
 
-            response_time = metrics.get("ha_bridge_request_duration_seconds", 0)
-            self.response_time_label.setText(f"{response_time:.2f}s")
-            self.response_time_label.setStyleSheet(
-                f"color: {'#4CAF50' if response_time < 2 else '#FF9800' if response_time < 5 else '#F44336'};"
-            )
+        except Exception as e:
+            logger.error(f"Error updating metrics: {e}")
 
-            total_requests = metrics.get("ha_bridge_requests_total", 0)
-            self.total_requests_label.setText(str(total_requests))
-
-            # Calculate error rate
-            error_requests = metrics.get("ha_bridge_errors_total", 0)
-            error_rate = 0
-            if total_requests > 0:
-                error_rate = (error_requests / total_requests) * 100
-            self.error_rate_label.setText(f"{error_rate:.1f}%")
-            self.error_rate_label.setStyleSheet(
-                f"color: {'#4CAF50' if error_rate < 5 else '#FF9800' if error_rate < 10 else '#F44336'};"
-            )
+    def update_labels(self, data: Dict[str, Any]):
+        """Update every label in the panel from a changed payload"""
+        status_data = data.get("status", {})
+        metrics = data.get("metrics", {})
 
-            # Calculate cache hit rate
-            cache_hits = metrics.get("ha_bridge_cache_hits_total", 0)
-            cache_misses = metrics.get("ha_bridge_cache_misses_total", 0)
-            hit_rate = 0
-            if cache_hits + cache_misses > 0:
-                hit_rate = (cache_hits / (cache_hits + cache_misses)) * 100
-            self.cache_hit_label.setText(f"{hit_rate:.1f}%")
-            self.cache_hit_label.setStyleSheet(
-                f"color: {'#4CAF50' if hit_rate >= 80 else '#FF9800' if hit_rate >= 60 else '#F44336'};"
-            )
+        # Update health overview
+        health = data.get("service_health", {})
+        score = health.get("score", 0)
+        status = health.get("status", "unknown")
+        issues = health.get("issues", [])
 
-            # Update chart
-            chart_type = self.chart_type_combo.currentText().lower().replace(" ", "_")
-            self.main_chart.update_chart(data, chart_type)
+        self.health_score_label.setText(str(score))
+        score_level = _level(score, _SCORE_BINS, _HIGHER_IS_BETTER)
+        self._set_style(self.health_score_label, _LEVEL_CSS[score_level])
 
-            # Update errors
-            if issues:
-                error_text = "\n".join([f"• {issue}" for issue in issues])
-                self.errors_text.setPlainText(error_text)
-            else:
-                self.errors_text.setPlainText("No issues detected")
+        self.health_status_label.setText(status.title())
+        self._set_style(
+            self.health_status_label,
+            _LEVEL_CSS[_HEALTH_LEVELS.get(status, "critical")],
+        )
 
-        except Exception as e:
-            logger.error(f"Error updating metrics: {e}")
+        # Update connection status
+        ha_connected = status_data.get("ha_connected", False)
+        self.ha_connection_label.setText(
+            "Connected" if ha_connected else "Disconnected"
+        )
+        self._set_style(
+            self.ha_connection_label,
+            _LEVEL_CSS["good" if ha_connected else "critical"],
+        )
+
+        ws_status = status_data.get("websocket") or {}
+        ws_connected = ws_status.get("connected", False)
+        self.ws_status_label.setText("Connected" if ws_connected else "Disconnected")
+        self._set_style(
+            self.ws_status_label, _LEVEL_CSS["good" if ws_connected else "critical"]
+        )
+
+        # Update production monitoring
+        self.update_production_monitoring(data)
+
+        # Update metrics
+        response_time = metrics.get("ha_bridge_request_duration_seconds", 0)
+        self.response_time_label.setText(f"{response_time:.2f}s")
+        response_level = _level(response_time, _RESPONSE_TIME_BINS, _LOWER_IS_BETTER)
+        self._set_style(self.response_time_label, _LEVEL_CSS[response_level])
+
+        total_requests = metrics.get("ha_bridge_requests_total", 0)
+        self.total_requests_label.setText(str(total_requests))
+
+        requests_per_minute = data.get("rates", {}).get("ha_bridge_requests_total", 0)
+        self.request_rate_label.setText(f"{requests_per_minute:.1f}/min")
+
+        # Calculate error rate
+        error_requests = metrics.get("ha_bridge_errors_total", 0)
+        error_rate = 0
+        if total_requests > 0:
+            error_rate = (error_requests / total_requests) * 100
+        self.error_rate_label.setText(f"{error_rate:.1f}%")
+        error_level = _level(error_rate, _ERROR_PERCENT_BINS, _LOWER_IS_BETTER)
+        self._set_style(self.error_rate_label, _LEVEL_CSS[error_level])
+
+        # Calculate cache hit rate
+        cache_hits = metrics.get("ha_bridge_cache_hits_total", 0)
+        cache_misses = metrics.get("ha_bridge_cache_misses_total", 0)
+        hit_rate = 0
+        if cache_hits + cache_misses > 0:
+            hit_rate = (cache_hits / (cache_hits + cache_misses)) * 100
+        self.cache_hit_label.setText(f"{hit_rate:.1f}%")
+        hit_level = _level(hit_rate, _SCORE_BINS, _HIGHER_IS_BETTER)
+        self._set_style(self.cache_hit_label, _LEVEL_CSS[hit_level])
+
+        # Update errors
+        self.set_errors_text(
+            "\n".join(f"• {issue}" for issue in issues) or "No issues detected"
+        )
+
+    def set_errors_text(self, text: str):
+        """Show text in the issues box, skipping the relayout if it's unchanged"""
+        if text != self._last_errors_text:
+            self.errors_text.setPlainText(text)
+            self._last_errors_text = text
+
+    def _set_style(self, widget: QWidget, css: str):
+        """Apply a stylesheet only when it differs from the last one applied"""
+        if self._last_style.get(widget) != css:
+            widget.setStyleSheet(css)
+            self._last_style[widget] = css
+
+    @staticmethod
+    def _payload_signature(data: Dict[str, Any]) -> str:
+        """Summarize everything the labels show (the health timestamp aside)"""
+        status_data = {
+            key: value
+            for key, value in data.get("status", {}).items()
+            if key != "timestamp"
+        }
+        return json.dumps(
+            [status_data, data.get("metrics", {}), data.get("rates", {})],
+            sort_keys=True,
+            default=str,
+        )
 
     def update_production_monitoring(self, data: Dict[str, Any]):
         """Update production monitoring indicators"""
@@ -743,7 +1015,7 @@ class MetricsPanel(QWidget):
             uptime_hours = (
                 24  # Placeholder - would be calculated from service start time
             )
-            self.uptime_label.setText(f"{uptime_hours:.1f} hours")
+            self.prod_uptime_label.setText(f"{uptime_hours:.1f} hours")
 
             # Calculate stability score based on error rate and response time
             metrics = data.get("metrics", {})
@@ -753,32 +1025,24 @@ class MetricsPanel(QWidget):
             # Stability score: 100 - (error_rate * 100) - (response_time * 10)
             stability_score = max(0, 100 - (error_rate * 100) - (response_time * 10))
             self.stability_label.setText(f"{stability_score:.1f}%")
-            self.stability_label.setStyleSheet(
-                f"color: {'#4CAF50' if stability_score >= 80 else '#FF9800' if stability_score >= 60 else '#F44336'};"
-            )
+            stability_level = _level(stability_score, _SCORE_BINS, _HIGHER_IS_BETTER)
+            self._set_style(self.stability_label, _LEVEL_CSS_BOLD[stability_level])
 
             # Calculate alerts based on thresholds
-            critical_alerts = 0
-            warning_alerts = 0
-
-            # Response time alerts
-            if response_time > 5:
-                critical_alerts += 1
-            elif response_time > 2:
-                warning_alerts += 1
-
-            # Error rate alerts
-            if error_rate > 0.1:  # 10% error rate
-                critical_alerts += 1
-            elif error_rate > 0.05:  # 5% error rate
-                warning_alerts += 1
+            response_level = _level(
+                response_time, _RESPONSE_TIME_BINS, _LOWER_IS_BETTER
+            )
+            error_level = _level(error_rate, _ERROR_RATIO_BINS, _LOWER_IS_BETTER)
+            levels = (response_level, error_level)
+            critical_alerts = levels.count("critical")
+            warning_alerts = levels.count("warning")
 
             # Connection alerts
             status_data = data.get("status", {})
             if not status_data.get("ha_connected", False):
                 critical_alerts += 1
 
-            websocket_status = status_data.get("websocket", {})
+            websocket_status = status_data.get("websocket") or {}
             if not websocket_status.get("connected", False):
                 warning_alerts += 1
 
@@ -787,31 +1051,20 @@ class MetricsPanel(QWidget):
             self.warning_alerts.setText(str(warning_alerts))
 
             # Update performance status
-            if response_time < 2:
-                self.response_status.setText("Good")
-                self.response_status.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            elif response_time < 5:
-                self.response_status.setText("Warning")
-                self.response_status.setStyleSheet("color: #FF9800; font-weight: bold;")
-            else:
-                self.response_status.setText("Critical")
-                self.response_status.setStyleSheet("color: #F44336; font-weight: bold;")
-
-            if error_rate < 0.05:
-                self.error_status.setText("Good")
-                self.error_status.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            elif error_rate < 0.1:
-                self.error_status.setText("Warning")
-                self.error_status.setStyleSheet("color: #FF9800; font-weight: bold;")
-            else:
-                self.error_status.setText("Critical")
-                self.error_status.setStyleSheet("color: #F44336; font-weight: bold;")
+            text, css = _LEVEL_STATUS[response_level]
+            self.response_status.setText(text)
+            self._set_style(self.response_status, css)
+
+            text, css = _LEVEL_STATUS[error_level]
+            self.error_status.setText(text)
+            self._set_style(self.error_status, css)
 
             # Update production readiness indicators
             production_ready = critical_alerts == 0 and stability_score >= 80
             self.production_ready.setText("✓" if production_ready else "✗")
-            self.production_ready.setStyleSheet(
-                f"color: {'#4CAF50' if production_ready else '#F44336'}; font-weight: bold; font-size: 18px;"
+            self._set_style(
+                self.production_ready,
+                _LEVEL_CSS_ICON["good" if production_ready else "critical"],
             )
 
             # Security status (simplified check)
@@ -819,8 +1072,9 @@ class MetricsPanel(QWidget):
                 "ha_connected", False
             ) and websocket_status.get("connected", False)
             self.security_status.setText("✓" if security_ok else "✗")
-            self.security_status.setStyleSheet(
-                f"color: {'#4CAF50' if security_ok else '#F44336'}; font-weight: bold; font-size: 18px;"
+            self._set_style(
+                self.security_status,
+                _LEVEL_CSS_ICON["good" if security_ok else "critical"],
             )
 
         except Exception as e:
@@ -829,16 +1083,27 @@ class MetricsPanel(QWidget):
     @pyqtSlot(str)
     def handle_error(self, error_msg: str):
         """Handle data fetching errors"""
-        self.errors_text.setPlainText(f"Error fetching metrics: {error_msg}")
+        self.set_errors_text(f"Error fetching metrics: {error_msg}")
+        self._last_signature = None  # repaint everything once data is back
         logger.error(f"Metrics fetch error: {error_msg}")
 
     def update_chart_type(self, chart_type: str):
         """Update chart type"""
-        # This will be called when the chart type combo box changes
-        # The actual chart update will happen in update_metrics
-        pass
+        self.main_chart.show_chart(chart_type.lower().replace(" ", "_"))
+
+    def pause(self):
+        """Stop periodic fetches while the dashboard can't be seen"""
+        self.refresh_timer.stop()
+
+    def resume(self):
+        """Restart periodic fetches (if auto-refresh is on) once visible again"""
+        self.toggle_auto_refresh(self.auto_refresh_cb.isChecked())
 
-    def closeEvent(self, event):
-        """Clean up when closing"""
+    def shutdown(self):
+        """Stop fetching and release the fetcher's client and loop thread
+
+        A tab page never receives closeEvent, so the owning window calls this.
+        The fetcher restarts its loop on the next fetch if the panel resumes.
+        """
+        self.refresh_timer.stop()
         self.data_fetcher.stop()
-        event.accept()
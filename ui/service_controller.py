@@ -7,17 +7,32 @@ import subprocess
 import psutil
 import time
 import os
+import select
 import signal
 import logging
+import mmap
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple, TypedDict
 import httpx
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+class StatusDict(TypedDict):
+    """Service status snapshot returned by get_service_status"""
+
+    running: bool
+    pid: Optional[int]
+    uptime: Optional[str]
+    health: bool
+    url: str
+    error: Optional[str]
+
+
 class ServiceController:
     """Controls the HA Bridge service process"""
 
@@ -26,82 +41,45 @@ class ServiceController:
         self.pid_file = self.project_root / "service.pid"
         self.log_file = self.project_root / "service.log"
         self.start_script = self.project_root / "start.py"
-        self.service_url = "http://127.0.0.1:8000"
+        self.service_port = 8000
+        self.service_url = f"http://127.0.0.1:{self.service_port}"
         self.process: Optional[psutil.Process] = None
+        self._process_pid: Optional[int] = None
+        self._process_create_time = 0.0  # fixed for the life of self.process
+        # Last (monotonic time, cpu_percent) sample of self.process
+        self._cpu_sample: Tuple[float, float] = (float("-inf"), 0.0)
+        self._cpu_min_interval = 0.5
+        self._pid_cache: Optional[Tuple[int, int]] = None  # (mtime_ns, pid)
         self.start_time: Optional[datetime] = None
-
-    def _is_port_in_use(self, port: int) -> bool:
-        """Check if a port is in use"""
-        try:
-            import socket
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                result = s.connect_ex(('localhost', port))
-                return result == 0
-        except Exception:
-            return False
-
-    def _kill_process_on_port(self, port: int) -> bool:
-        """Kill process using the specified port (non-interactive)"""
-        try:
-            if os.name == "nt":  # Windows
-                import subprocess
-                # Find process using netstat
-                result = subprocess.run(
-                    ["netstat", "-ano"], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=10
-                )
-                
-                for line in result.stdout.split('\n'):
-                    if f':{port}' in line and 'LISTENING' in line:
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            pid = parts[-1]
-                            try:
-                                # Kill the process
-                                subprocess.run(
-                                    ["taskkill", "/F", "/PID", pid],
-                                    capture_output=True,
-                                    timeout=5
-                                )
-                                logger.info(f"Killed process {pid} on port {port}")
-                                return True
-                            except Exception as e:
-                                logger.warning(f"Failed to kill process {pid}: {e}")
-            else:  # Unix/Linux
-                import subprocess
-                # Find process using lsof
-                result = subprocess.run(
-                    ["lsof", "-ti", f":{port}"], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=10
-                )
-                
-                if result.stdout.strip():
-                    pid = result.stdout.strip()
-                    try:
-                        # Kill the process
-                        subprocess.run(
-                            ["kill", "-9", pid],
-                            capture_output=True,
-                            timeout=5
-                        )
-                        logger.info(f"Killed process {pid} on port {port}")
-                        return True
-                    except Exception as e:
-                        logger.warning(f"Failed to kill process {pid}: {e}")
-            
-            return False
-        except Exception as e:
-            logger.warning(f"Failed to kill process on port {port}: {e}")
-            return False
-
-    def get_service_status(self) -> Dict[str, Any]:
-        """Get comprehensive service status"""
-        status = {
+        # Run uvicorn directly (non-interactive), avoiding the prompts in start.py
+        self._start_argv = [
+            "python",
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "0.0.0.0",
+            "--port",
+            str(self.service_port),
+            "--reload",
+        ]
+        # Force UTF-8 output to prevent encoding issues in the log file
+        self._start_env = {**os.environ, "PYTHONIOENCODING": "utf-8"}
+        # Fail fast when nothing is listening, but give a slow /health time to
+        # answer so a busy service isn't reported as down
+        self._http_timeout = httpx.Timeout(5.0, connect=0.5)
+        # Keep-alive client reused by every health probe
+        self._http = httpx.Client(
+            base_url=self.service_url,
+            timeout=self._http_timeout,
+            limits=httpx.Limits(max_keepalive_connections=2, max_connections=2),
+        )
+        # Last status snapshot, reused by calls within _status_ttl seconds
+        self._status_cache: Optional[StatusDict] = None
+        self._status_cache_ts = 0.0
+        self._status_ttl = 1.5
+        # Status reported whenever there is no live service process
+        self._not_running: StatusDict = {
             "running": False,
             "pid": None,
             "uptime": None,
@@ -109,107 +87,458 @@ class ServiceController:
             "url": self.service_url,
             "error": None,
         }
+        # Last /health response body (None if unreachable), reused by probes
+        # made within _health_min_interval seconds
+        self._health_min_interval = 0.25
+        # How long a read waits to replace a body older than _status_ttl
+        self._health_stale_wait = 1.0
+        self._health_snapshot: Tuple[float, Optional[Dict[str, Any]]] = (
+            float("-inf"),
+            None,
+        )
+        # Bumped by invalidate_status_cache so probes already in flight can't
+        # store a body from before a start/stop
+        self._health_generation = 0
+        self._health_lock = threading.Lock()
+        # Background asyncio loop that runs the health/WebSocket probes, so a
+        # refused or slow connection never blocks the calling thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.RLock()
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._probes: Dict[str, Future] = {}
+        self._closed = False  # set by close(); no new loop or client after it
+        # One controller is shared by the tray monitor thread and the pool
+        # workers. _state_lock guards the process handle and the PID/status
+        # caches and is only held for quick reads and updates, never across a
+        # health wait or process exit; _action_lock keeps start/stop/restart
+        # from overlapping without making status reads wait on them
+        self._state_lock = threading.RLock()
+        self._action_lock = threading.RLock()
+        # Read-only map of the log, keyed by (st_dev, st_ino), reused while the
+        # file is unchanged; the lock keeps log workers from racing a remap
+        self._log_map: Optional[Tuple[Tuple[int, int], mmap.mmap]] = None
+        self._log_lock = threading.Lock()
+        # Last tail read, keyed by the file's identity, size, mtime and line count
+        self._log_tail: Optional[Tuple[Tuple[int, ...], List[str]]] = None
+
+    def cancel_probes(self):
+        """Cancel in-flight probes, releasing any thread waiting on one"""
+        with self._loop_lock:
+            for future in self._probes.values():
+                future.cancel()
+            self._probes.clear()
+
+    def close(self):
+        """Close the HTTP clients and stop the probe loop (call on UI shutdown)"""
+        with self._loop_lock:
+            self._closed = True
+        self.cancel_probes()
+        self._http.close()
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            thread, self._loop_thread = self._loop_thread, None
+        if loop is None:
+            return
+
+        if self._aclient is not None:
+            future = asyncio.run_coroutine_threadsafe(self._aclient.aclose(), loop)
+            try:
+                future.result(timeout=1)
+            except Exception as e:
+                logger.debug(f"Failed to close async client: {e}")
+            self._aclient = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=1)
+        if not thread.is_alive():
+            loop.close()
+
+    @staticmethod
+    def _is_listener(conn, port: int) -> bool:
+        """Check if a psutil connection is listening on the port"""
+        return bool(
+            conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN
+        )
+
+    def _listener_pids(self, port: int) -> Set[int]:
+        """PIDs listening on the port, from one system-wide connection scan
+
+        The system-wide scan needs root on macOS; when it's denied, fall back
+        to asking each process we're allowed to inspect for its connections.
+        """
+        try:
+            return {
+                conn.pid
+                for conn in psutil.net_connections(kind="inet")
+                if conn.pid and self._is_listener(conn, port)
+            }
+        except psutil.AccessDenied:
+            pass
 
+        pids = set()
+        for process in psutil.process_iter():
+            try:
+                # Renamed from connections() in psutil 6
+                connections = getattr(process, "net_connections", None)
+                connections = (connections or process.connections)(kind="inet")
+            except psutil.Error:
+                continue
+            if any(self._is_listener(conn, port) for conn in connections):
+                pids.add(process.pid)
+        return pids
+
+    def _ensure_port_free(self, port: int) -> bool:
+        """Stop any process listening on the port"""
         try:
-            # Check if PID file exists and process is running
-            if self.pid_file.exists():
-                with open(self.pid_file, "r") as f:
-                    pid = int(f.read().strip())
+            pids = self._listener_pids(port)
+        except Exception as e:
+            logger.warning(f"Failed to check port {port}: {e}")
+            return False
 
+        freed = True
+        for pid in pids:
+            try:
+                process = psutil.Process(pid)
+                process.terminate()
                 try:
-                    self.process = psutil.Process(pid)
-                    if (
-                        self.process.is_running()
-                        and self.process.status() != psutil.STATUS_ZOMBIE
-                    ):
-                        status["running"] = True
-                        status["pid"] = pid
-
-                        # Calculate uptime
-                        create_time = datetime.fromtimestamp(self.process.create_time())
-                        status["uptime"] = str(datetime.now() - create_time).split(".")[
-                            0
-                        ]
-
-                        # Check health endpoint
-                        status["health"] = self._check_health()
+                    process.wait(timeout=1)
+                except psutil.TimeoutExpired:
+                    process.kill()
+                    process.wait(timeout=3)
+                logger.info(f"Killed process {pid} on port {port}")
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.Error as e:
+                logger.warning(f"Failed to kill process {pid}: {e}")
+                freed = False
+
+        return freed
+
+    def invalidate_status_cache(self):
+        """Force the next get_service_status call to re-check everything"""
+        with self._state_lock:
+            self._status_cache = None
+            with self._health_lock:
+                self._health_generation += 1
+                self._health_snapshot = (float("-inf"), None)
+
+    def get_service_status(self) -> StatusDict:
+        """Get comprehensive service status (cached for _status_ttl seconds)"""
+        with self._state_lock:
+            if (
+                self._status_cache is not None
+                and time.monotonic() - self._status_cache_ts < self._status_ttl
+            ):
+                return dict(self._status_cache)
 
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    # Process doesn't exist or we can't access it
-                    self._cleanup_pid_file()
+            status = self._collect_service_status()
+
+        # May wait on the health probe, so never under the lock
+        if status["running"]:
+            status["health"] = self._check_health()
 
+        with self._state_lock:
+            self._status_cache = dict(status)
+            self._status_cache_ts = time.monotonic()
+        return status
+
+    def _collect_service_status(self) -> StatusDict:
+        """Check the PID file and process (caller holds _state_lock, adds health)"""
+        try:
+            pid = self._read_pid()
         except (ValueError, FileNotFoundError):
-            # PID file doesn't exist or is invalid
-            pass
+            # PID file is invalid or was removed while reading it
+            pid = None
+
+        # No PID file: the service isn't running, so skip psutil entirely
+        status = dict(self._not_running)
+        if pid is None:
+            return status
+
+        try:
+            # Keep the handle while the PID is unchanged so cpu_percent
+            # can measure against the previous poll
+            if self.process is None or pid != self._process_pid:
+                self.process = psutil.Process(pid)
+                self._process_pid = pid
+                self._process_create_time = self.process.create_time()
+                self.process.cpu_percent(interval=None)  # prime
+                self._cpu_sample = (time.monotonic(), 0.0)
+
+            # Read every process field in one batch of system calls
+            with self.process.oneshot():
+                running = (
+                    self.process.is_running()
+                    and self.process.status() != psutil.STATUS_ZOMBIE
+                )
+
+            if running:
+                status["running"] = True
+                status["pid"] = pid
+
+                # Calculate uptime as H:MM:SS
+                secs = max(0, int(time.time() - self._process_create_time))
+                hours, minutes = secs // 3600, secs // 60 % 60
+                status["uptime"] = f"{hours}:{minutes:02d}:{secs % 60:02d}"
+            else:
+                # Exited or PID reused: rebuild the handle on the next poll
+                self.process = None
+                self._process_pid = None
+
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            # Process doesn't exist or we can't access it
+            self.process = None
+            self._process_pid = None
+            self._cleanup_pid_file()
 
         return status
 
+    def _is_running_fast(self) -> Optional[int]:
+        """PID of the service if the PID file names a live process (no health probe)
+
+        Reaps our own exited child first, and treats zombies and reused PIDs
+        as not running, removing the stale PID file in that case. The caller
+        holds _state_lock, since this may drop the shared process handle.
+        """
+        try:
+            pid = self._read_pid()
+        except (ValueError, OSError):
+            return None
+        if pid is None:
+            return None
+
+        if os.name != "nt":
+            self._reap(pid)  # a crashed child stays a zombie until reaped
+        # Reuse the status poll's handle when it names this PID, so the
+        # common case builds no new psutil.Process
+        process = self.process if pid == self._process_pid else None
+        try:
+            if process is not None:
+                # Compares the handle's create_time, so PID reuse shows too
+                alive = process.is_running()
+            else:
+                process = psutil.Process(pid)
+                alive = not self._is_reused_pid(pid, process.create_time())
+            alive = alive and process.status() != psutil.STATUS_ZOMBIE
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            alive = False
+
+        if alive:
+            return pid
+
+        if pid == self._process_pid:
+            self.process = None
+            self._process_pid = None
+        self._cleanup_pid_file()
+        return None
+
+    def _is_reused_pid(self, pid: int, created: float) -> bool:
+        """Check if the process now holding pid isn't the one we started
+
+        The service is started before its PID file is written, so a process
+        created after the file (allowing for clock granularity) is another one.
+        """
+        if self._pid_cache is not None and self._pid_cache[1] == pid:
+            return created > self._pid_cache[0] / 1e9 + 1.0
+        return False
+
+    def _read_pid(self) -> Optional[int]:
+        """Read the PID file, reusing the last value while its mtime is unchanged"""
+        try:
+            mtime = self.pid_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        if self._pid_cache is not None and self._pid_cache[0] == mtime:
+            return self._pid_cache[1]
+
+        pid = int(self.pid_file.read_text().strip())
+        self._pid_cache = (mtime, pid)
+        return pid
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="ServiceControllerLoop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def _schedule_probe(self, name: str, coro_fn) -> Future:
+        """Run a probe coroutine on the background loop (one in flight per name)
+
+        Once closed, returns an already completed Future holding None instead
+        of starting a loop (and client) that nothing would ever close.
+        """
+        with self._loop_lock:
+            if self._closed:
+                closed = Future()
+                closed.set_result(None)
+                return closed
+
+            pending = self._probes.get(name)
+            if pending is None or pending.done():
+                pending = asyncio.run_coroutine_threadsafe(
+                    coro_fn(), self._ensure_loop()
+                )
+                self._probes[name] = pending
+            return pending
+
+    async def _fetch_health_snapshot_async(self) -> Optional[Dict[str, Any]]:
+        """GET /health once and record the parsed body (None if not healthy)"""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.service_url,
+                timeout=self._http_timeout,
+                limits=httpx.Limits(max_keepalive_connections=2, max_connections=2),
+            )
+
+        while True:
+            generation = self._health_generation
+            snapshot = None
+            try:
+                response = await self._aclient.get("/health")
+                if response.status_code == 200:
+                    snapshot = response.json()
+            except Exception as e:
+                logger.debug(f"Health probe failed: {e}")
+
+            # Invalidated mid-probe: the body predates it, so probe again
+            with self._health_lock:
+                if generation == self._health_generation:
+                    self._health_snapshot = (time.monotonic(), snapshot)
+                    return snapshot
+
+    def _fetch_health_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Get the /health body shared by the health and WebSocket checks
+
+        Returns the last known body and refreshes it in the background. The
+        first probe (or the first after invalidate_status_cache) waits for the
+        answer; a body older than _status_ttl waits briefly for a fresh one so
+        a service that died between slow polls isn't reported healthy.
+        """
+        checked_at, snapshot = self._health_snapshot
+        age = time.monotonic() - checked_at
+        if age < self._health_min_interval:
+            return snapshot
+
+        future = self._schedule_probe("health", self._fetch_health_snapshot_async)
+        if checked_at == float("-inf"):
+            try:
+                return future.result(timeout=6)
+            except Exception:
+                return None
+        if age > self._status_ttl:
+            try:
+                return future.result(timeout=self._health_stale_wait)
+            except Exception:
+                # Still answering slowly: keep the last body until it lands
+                return snapshot
+        return snapshot
+
     def _check_health(self) -> bool:
         """Check if service is responding to health endpoint"""
-        try:
-            import requests
+        return self._fetch_health_snapshot() is not None
 
-            response = requests.get(f"{self.service_url}/health", timeout=5)
-            return response.status_code == 200
-        except Exception:
-            return False
+    def _wait_until_healthy(
+        self, process: subprocess.Popen, deadline_s: float = 5.0
+    ) -> bool:
+        """Poll the health endpoint with exponential backoff until it answers"""
+        deadline = time.monotonic() + deadline_s
+        delay = 0.05
+
+        while process.poll() is None:
+            try:
+                if self._http.get("/health", timeout=0.5).status_code == 200:
+                    return True
+            except httpx.HTTPError:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Sleep between probes, but wake at once if the process dies
+            if os.name == "nt":
+                try:
+                    process.wait(timeout=min(delay, remaining))
+                except subprocess.TimeoutExpired:
+                    pass
+            else:
+                self._wait_for_exit(process.pid, timeout=min(delay, remaining))
+            delay = min(delay * 2, 0.5)
+
+        return False
+
+    def _write_pid(self, pid: int):
+        """Replace the PID file atomically so pollers never see a partial write"""
+        tmp_file = self.pid_file.with_suffix(".pid.tmp")
+        tmp_file.write_text(str(pid))
+        os.replace(tmp_file, self.pid_file)
 
     def _cleanup_pid_file(self):
         """Remove stale PID file"""
+        with self._state_lock:
+            self._pid_cache = None
         try:
-            if self.pid_file.exists():
-                self.pid_file.unlink()
-                logger.info("Cleaned up stale PID file")
+            self.pid_file.unlink()
+            logger.info("Cleaned up stale PID file")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Failed to cleanup PID file: {e}")
 
     def start_service(self) -> Dict[str, Any]:
         """Start the bridge service"""
+        with self._action_lock:
+            return self._start_service()
+
+    def _start_service(self) -> Dict[str, Any]:
+        """Start the service (caller holds _action_lock)"""
         result = {"success": False, "message": "", "pid": None}
+        self.invalidate_status_cache()
 
         try:
             # Check if already running
-            status = self.get_service_status()
-            if status["running"]:
+            with self._state_lock:
+                pid = self._is_running_fast()
+            if pid is not None:
                 result["message"] = "Service is already running"
-                result["pid"] = status["pid"]
+                result["pid"] = pid
+                return result
+
+            # Kill any conflicting process still listening on the port
+            if not self._ensure_port_free(self.service_port):
+                result["message"] = f"Port {self.service_port} is in use"
                 return result
 
             # Start the service using uvicorn directly (non-interactive)
-            # This avoids the interactive prompts in start.py
             with open(self.log_file, "a", encoding="utf-8", errors="replace") as log_f:
-                # Set environment to prevent encoding issues
-                env = os.environ.copy()
-                env["PYTHONIOENCODING"] = "utf-8"
-
-                # Check if port is in use and kill conflicting process if needed
-                port = 8000
-                if self._is_port_in_use(port):
-                    self._kill_process_on_port(port)
-
                 process = subprocess.Popen(
-                    [
-                        "python", "-m", "uvicorn", "app.main:app",
-                        "--host", "0.0.0.0", "--port", str(port),
-                        "--reload"
-                    ],
+                    self._start_argv,
                     stdout=log_f,
                     stderr=subprocess.STDOUT,
                     cwd=str(self.project_root),
-                    env=env,
+                    env=self._start_env,
                     creationflags=(
                         subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0
                     ),
+                    # Detach from the UI's terminal, as the new group does on Windows
+                    start_new_session=os.name != "nt",
                 )
 
             # Save PID
-            with open(self.pid_file, "w") as f:
-                f.write(str(process.pid))
+            self._write_pid(process.pid)
 
-            # Wait a moment for startup
-            time.sleep(2)
+            # Wait for the health endpoint to come up (or the process to die)
+            self._wait_until_healthy(process)
 
             # Verify it started
+            self.invalidate_status_cache()
             status = self.get_service_status()
             if status["running"]:
                 result["success"] = True
@@ -228,46 +557,57 @@ class ServiceController:
 
     def stop_service(self) -> Dict[str, Any]:
         """Stop the bridge service gracefully"""
+        with self._action_lock:
+            return self._stop_service()
+
+    def _stop_service(self) -> Dict[str, Any]:
+        """Stop the service (caller holds _action_lock)"""
         result = {"success": False, "message": ""}
+        self.invalidate_status_cache()
 
         try:
-            status = self.get_service_status()
-            if not status["running"]:
+            with self._state_lock:
+                pid = self._is_running_fast()
+            if pid is None:
                 result["message"] = "Service is not running"
                 return result
 
-            # Get the process
-            if self.pid_file.exists():
-                with open(self.pid_file, "r") as f:
-                    pid = int(f.read().strip())
-
-                try:
+            try:
+                if os.name == "nt":
+                    # Windows: TerminateProcess, then wait on the process handle
                     process = psutil.Process(pid)
-
-                    # Try graceful shutdown first
-                    if os.name == "nt":
-                        # Windows
-                        process.terminate()
-                    else:
-                        # Unix
-                        process.send_signal(signal.SIGTERM)
-
-                    # Wait for graceful shutdown
+                    process.terminate()
                     try:
                         process.wait(timeout=10)
                     except psutil.TimeoutExpired:
                         # Force kill if graceful shutdown failed
                         process.kill()
                         process.wait()
+                else:
+                    # Unix: try graceful shutdown first, then force kill
+                    os.kill(pid, signal.SIGTERM)
+                    if not self._wait_for_exit(pid, timeout=10):
+                        try:
+                            os.kill(pid, signal.SIGKILL)
+                        except ProcessLookupError:
+                            pass  # exited just after the timeout
+                        else:
+                            self._wait_for_exit(pid, timeout=5)
 
-                    result["success"] = True
-                    result["message"] = "Service stopped successfully"
+                result["success"] = True
+                result["message"] = "Service stopped successfully"
 
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    result["message"] = "Service process not found or access denied"
+            except (
+                psutil.NoSuchProcess,
+                psutil.AccessDenied,
+                ProcessLookupError,
+                PermissionError,
+            ):
+                result["message"] = "Service process not found or access denied"
 
             # Cleanup
             self._cleanup_pid_file()
+            self.invalidate_status_cache()
 
         except Exception as e:
             result["message"] = f"Failed to stop service: {str(e)}"
@@ -275,8 +615,55 @@ class ServiceController:
 
         return result
 
+    @staticmethod
+    def _reap(pid: int) -> bool:
+        """Collect the exit status if pid is our exited child"""
+        try:
+            return os.waitpid(pid, os.WNOHANG)[0] == pid
+        except ChildProcessError:
+            return False  # not our child (e.g. started by an earlier session)
+
+    def _wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """Wait until a POSIX process exits, returning False on timeout
+
+        Uses a pidfd where available (Linux 5.3+) so the kernel wakes us as
+        soon as the process exits; otherwise polls with exponential backoff.
+        """
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                return True
+            except OSError:
+                pidfd = None  # kernel without pidfd support
+
+            if pidfd is not None:
+                try:
+                    ready, _, _ = select.select([pidfd], [], [], timeout)
+                finally:
+                    os.close(pidfd)
+                if ready:
+                    self._reap(pid)
+                return bool(ready)
+
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while not (self._reap(pid) or not psutil.pid_exists(pid)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
+        return True
+
     def restart_service(self) -> Dict[str, Any]:
         """Restart the bridge service"""
+        # Held across both steps so no other action lands between them
+        with self._action_lock:
+            return self._restart_service()
+
+    def _restart_service(self) -> Dict[str, Any]:
+        """Stop then start the service (caller holds _action_lock)"""
         result = {"success": False, "message": ""}
 
         try:
@@ -289,10 +676,7 @@ class ServiceController:
                 result["message"] = f"Failed to stop service: {stop_result['message']}"
                 return result
 
-            # Wait a moment
-            time.sleep(1)
-
-            # Start again
+            # Start again (stop_service has already waited for the exit)
             start_result = self.start_service()
             if start_result["success"]:
                 result["success"] = True
@@ -314,10 +698,7 @@ class ServiceController:
 
         try:
             if self.log_file.exists():
-                with open(self.log_file, "r", encoding="utf-8", errors="ignore") as f:
-                    all_lines = f.readlines()
-                    logs = all_lines[-lines:] if len(all_lines) > lines else all_lines
-                    logs = [line.rstrip() for line in logs]
+                logs = self._read_log_tail(lines)
             else:
                 logs = ["No log file found"]
 
@@ -327,13 +708,64 @@ class ServiceController:
 
         return logs
 
+    def _read_log_tail(self, lines: int) -> List[str]:
+        """Read the last lines of the log by scanning its memory map backwards
+
+        The result is reused until the file's identity, size or mtime changes.
+        """
+        with self._log_lock:
+            st = os.stat(self.log_file)
+            key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, lines)
+            if self._log_tail is not None and self._log_tail[0] == key:
+                return list(self._log_tail[1])
+
+            tail: List[str] = []
+            mm = self._map_log(st)
+            if mm is not None:
+                # One extra newline guarantees the oldest wanted line is complete
+                start = len(mm)
+                for _ in range(lines + 1):
+                    start = mm.rfind(b"\n", 0, start)
+                    if start < 0:
+                        break
+                text = mm[start + 1 :].decode("utf-8", errors="ignore")
+                tail = [line.rstrip() for line in text.splitlines()[-lines:]]
+
+            self._log_tail = (key, tail)
+        return list(tail)
+
+    def _map_log(self, st: os.stat_result) -> Optional[mmap.mmap]:
+        """Get a read-only map of the log, remapping only when the file changed"""
+        if self._log_map is not None:
+            key, mm = self._log_map
+            if key == (st.st_dev, st.st_ino) and len(mm) == st.st_size:
+                return mm
+            self._close_log_map()
+
+        if st.st_size == 0:
+            return None  # empty files can't be mapped
+
+        with open(self.log_file, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._log_map = ((st.st_dev, st.st_ino), mm)
+        return mm
+
+    def _close_log_map(self):
+        """Release the cached log map (Windows can't delete a mapped file)"""
+        if self._log_map is not None:
+            self._log_map[1].close()
+            self._log_map = None
+
     def clear_logs(self) -> bool:
         """Clear service logs"""
         try:
-            if self.log_file.exists():
-                self.log_file.unlink()
-                logger.info("Service logs cleared")
-                return True
+            with self._log_lock:
+                self._close_log_map()
+                self._log_tail = None
+                if self.log_file.exists():
+                    self.log_file.unlink()
+                    logger.info("Service logs cleared")
+                    return True
         except Exception as e:
             logger.error(f"Failed to clear logs: {e}")
             return False
@@ -348,11 +780,11 @@ class ServiceController:
         }
 
         try:
-            import requests
-
-            start_time = time.time()
-            response = requests.get(f"{self.service_url}/health", timeout=10)
-            response_time = time.time() - start_time
+            start_time = time.perf_counter()
+            response = self._http.get(
+                "/health", timeout=httpx.Timeout(10.0, connect=0.5)
+            )
+            response_time = time.perf_counter() - start_time
 
             result["response_time"] = round(response_time * 1000, 2)  # ms
             result["status_code"] = response.status_code
@@ -367,9 +799,9 @@ class ServiceController:
                     f"Service responded with status {response.status_code}"
                 )
 
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             result["message"] = "Connection refused - service may not be running"
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             result["message"] = "Connection timeout - service may be overloaded"
         except Exception as e:
             result["message"] = f"Connection test failed: {str(e)}"
@@ -387,31 +819,42 @@ class ServiceController:
             "pid_file": str(self.pid_file),
         }
 
-        if status["running"] and self.process:
-            try:
-                info["memory_usage"] = (
-                    self.process.memory_info().rss / 1024 / 1024
-                )  # MB
-                info["cpu_percent"] = self.process.cpu_percent()
-                info["num_threads"] = self.process.num_threads()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        with self._state_lock:
+            process = self.process
+            if status["running"] and process:
+                try:
+                    with process.oneshot():
+                        info["memory_usage"] = (
+                            process.memory_info().rss / 1024 / 1024
+                        )  # MB
+                        info["cpu_percent"] = self._sample_cpu_percent()
+                        info["num_threads"] = process.num_threads()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
 
         return info
 
-    def get_websocket_status(self) -> Dict[str, Any]:
-        """Get WebSocket connection status from service."""
-        try:
-            import requests
+    def _sample_cpu_percent(self) -> float:
+        """CPU usage since the last sample, reused for calls close together
 
-            response = requests.get(f"{self.service_url}/health", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                return data.get(
-                    "websocket",
-                    {"connected": False, "error": "WebSocket info not available"},
-                )
-        except Exception as e:
-            logger.error(f"Failed to get WebSocket status: {e}")
+        cpu_percent(interval=None) measures against the previous call, so two
+        refreshes a few milliseconds apart would report a meaningless 0.0.
+        """
+        now = time.monotonic()
+        sampled_at, percent = self._cpu_sample
+        if now - sampled_at >= self._cpu_min_interval:
+            percent = self.process.cpu_percent(interval=None)
+            self._cpu_sample = (now, percent)
+        return percent
 
-        return {"connected": False, "error": "Service not responding"}
+    def get_websocket_status(self) -> Dict[str, Any]:
+        """Get WebSocket connection status from service."""
+        snapshot = self._fetch_health_snapshot()
+        if snapshot is None:
+            return {"connected": False, "error": "Service not responding"}
+        # /health reports null when the WebSocket client isn't enabled
+        ws_status = snapshot.get("websocket") or {
+            "connected": False,
+            "error": "WebSocket info not available",
+        }
+        return dict(ws_status)
@@ -4,11 +4,13 @@ Handles adding/removing the application from Windows startup
 """
 
 import os
+import subprocess
 import sys
+import time
 import winreg
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,13 @@ class StartupManager:
         self.app_name = app_name
         self.registry_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
         self.startup_folder = self._get_startup_folder()
+        # Launcher command line, fixed for the life of the process
+        self.launcher_path = Path(__file__).parent.parent / "ui_launcher.py"
+        self.pythonw_path = self._get_pythonw_path()
+        self.app_path = self._get_app_path()
+        # (monotonic time, enabled) from the last registry check
+        self._enabled_cache: Optional[Tuple[float, bool]] = None
+        self._enabled_ttl = 1.0
 
     def _get_startup_folder(self) -> Path:
         """Get the Windows startup folder path"""
@@ -47,41 +56,60 @@ class StartupManager:
                 / "Startup"
             )
 
+    @staticmethod
+    def _get_pythonw_path() -> Path:
+        """Get pythonw.exe next to the running interpreter (no console window)"""
+        python_path = Path(sys.executable)
+        pythonw_path = python_path.with_name("pythonw.exe")
+        return pythonw_path if pythonw_path.exists() else python_path
+
     def _get_app_path(self) -> str:
-        """Get the full path to the UI launcher"""
+        """Get the full command line that runs the UI launcher"""
         try:
-            # Get the path to ui_launcher.py
-            current_dir = Path(__file__).parent.parent  # Go up from ui/ to project root
-            launcher_path = current_dir / "ui_launcher.py"
-
-            # Use pythonw.exe to run without console window
-            pythonw_path = sys.executable.replace("python.exe", "pythonw.exe")
-            return f'"{pythonw_path}" "{launcher_path}" --minimized'
+            return subprocess.list2cmdline(
+                [str(self.pythonw_path), str(self.launcher_path), "--minimized"]
+            )
 
         except Exception as e:
             logger.error(f"Failed to get app path: {e}")
             return ""
 
     def is_startup_enabled(self) -> bool:
-        """Check if the application is set to run on startup"""
+        """Check if the application is set to run on startup (cached briefly)"""
+        now = time.monotonic()
+        if (
+            self._enabled_cache is not None
+            and now - self._enabled_cache[0] < self._enabled_ttl
+        ):
+            return self._enabled_cache[1]
+
+        enabled = self._read_startup_enabled()
+        self._enabled_cache = (now, enabled)
+        return enabled
+
+    def _read_startup_enabled(self) -> bool:
+        """Check the registry for the startup entry"""
         try:
-            # Check registry
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key) as key:
-                try:
-                    value, _ = winreg.QueryValueEx(key, self.app_name)
-                    return bool(value)
-                except FileNotFoundError:
-                    # Key doesn't exist
-                    return False
-
+            return bool(self._query_startup_value())
         except Exception as e:
             logger.error(f"Failed to check startup status: {e}")
             return False
 
+    def _query_startup_value(self) -> Optional[str]:
+        """Read the startup entry from the registry (None if it isn't set)"""
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key) as key:
+            try:
+                value, _ = winreg.QueryValueEx(key, self.app_name)
+                return value
+            except FileNotFoundError:
+                # Value doesn't exist
+                return None
+
     def enable_startup(self) -> bool:
         """Enable startup on Windows login"""
+        self._enabled_cache = None
         try:
-            app_path = self._get_app_path()
+            app_path = self.app_path
             if not app_path:
                 logger.error("Failed to get application path")
                 return False
@@ -101,6 +129,7 @@ class StartupManager:
 
     def disable_startup(self) -> bool:
         """Disable startup on Windows login"""
+        self._enabled_cache = None
         try:
             # Remove from registry
             with winreg.OpenKey(
@@ -129,22 +158,21 @@ class StartupManager:
     def get_startup_info(self) -> dict:
         """Get detailed startup information"""
         info = {
-            "enabled": self.is_startup_enabled(),
+            "enabled": False,
             "app_name": self.app_name,
             "registry_key": self.registry_key,
             "startup_folder": str(self.startup_folder),
-            "app_path": self._get_app_path(),
+            "app_path": self.app_path,
         }
 
-        # Try to get the actual registry value
+        # Read the registry value once and derive the enabled flag from it
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key) as key:
-                try:
-                    value, _ = winreg.QueryValueEx(key, self.app_name)
-                    info["registry_value"] = value
-                except FileNotFoundError:
-                    info["registry_value"] = None
+            value = self._query_startup_value()
+            info["registry_value"] = value
+            info["enabled"] = bool(value)
+            self._enabled_cache = (time.monotonic(), info["enabled"])
         except Exception as e:
+            logger.error(f"Failed to check startup status: {e}")
             info["registry_error"] = str(e)
 
         return info
@@ -155,7 +183,7 @@ class StartupManager:
             import winshell
             from win32com.client import Dispatch
 
-            app_path = self._get_app_path()
+            app_path = self.app_path
             if not app_path:
                 return False
 
@@ -163,9 +191,11 @@ class StartupManager:
             shortcut_path = self.startup_folder / f"{self.app_name}.lnk"
             shell = Dispatch("WScript.Shell")
             shortcut = shell.CreateShortCut(str(shortcut_path))
-            shortcut.Targetpath = app_path.split('"')[1]  # Remove quotes
-            shortcut.Arguments = "--minimized"
-            shortcut.WorkingDirectory = str(Path(__file__).parent.parent)
+            shortcut.Targetpath = str(self.pythonw_path)
+            shortcut.Arguments = subprocess.list2cmdline(
+                [str(self.launcher_path), "--minimized"]
+            )
+            shortcut.WorkingDirectory = str(self.launcher_path.parent)
             shortcut.save()
 
             logger.info(f"Created startup shortcut: {shortcut_path}")
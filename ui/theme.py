@@ -0,0 +1,22 @@
+"""
+Theme Loader for HA Bridge Control UI
+Reads Qt stylesheets from ui/assets once per process
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+
+@lru_cache(maxsize=None)
+def load_stylesheet(name: str = "dark.qss") -> str:
+    """Load a stylesheet from the assets directory"""
+    try:
+        return (ASSETS_DIR / name).read_text(encoding="utf-8")
+    except OSError as e:
+        logger.error(f"Failed to load stylesheet {name}: {e}")
+        return ""
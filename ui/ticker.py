@@ -0,0 +1,40 @@
+"""
+Shared UI Ticker for HA Bridge Control UI
+One master timer that periodic widgets subscribe to instead of owning their own
+"""
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+def ms_to_ticks(interval_ms: int, tick_ms: int = 1000) -> int:
+    """Convert a millisecond interval to a whole number of ticks (at least 1)"""
+    return max(1, round(interval_ms / tick_ms))
+
+
+class UITicker(QObject):
+    """Emits a monotonically increasing tick count once per interval"""
+
+    tick = pyqtSignal(int)
+
+    def __init__(self, interval_ms: int = 1000, parent=None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self._count = 0
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_timeout)
+        self._timer.start(interval_ms)
+
+    def _on_timeout(self):
+        """Advance the tick count and notify subscribers"""
+        self._count += 1
+        self.tick.emit(self._count)
+
+    @property
+    def count(self) -> int:
+        """Number of ticks emitted so far"""
+        return self._count
+
+    def stop(self):
+        """Stop ticking"""
+        self._timer.stop()
@@ -4,45 +4,155 @@ Provides system tray icon with context menu and status monitoring
 """
 
 import sys
+import os
+import json
 import logging
+from functools import partial
 from pathlib import Path
-from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication, QMessageBox, QWidget
-from PyQt6.QtCore import QTimer, QObject, pyqtSignal, QThread
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import psutil
+from PyQt6.QtWidgets import (
+    QSystemTrayIcon,
+    QMenu,
+    QApplication,
+    QMessageBox,
+    QStyle,
+    QWidget,
+)
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    QObject,
+    pyqtSignal,
+    pyqtSlot,
+    QThread,
+    QThreadPool,
+)
 from PyQt6.QtGui import QIcon, QAction, QPixmap
 
 from ui.service_controller import ServiceController
 from ui.startup_manager import StartupManager
+from ui.icon_cache import get_tray_icon
+from ui.workers import FunctionJob
+from app.config.ui_config import ui_config
+
+if TYPE_CHECKING:
+    from ui.main_window import MainWindow
 
 logger = logging.getLogger(__name__)
 
+# Every connection states whether it stays on one thread (tray, menu, the
+# monitor's own timer) or crosses between the UI and monitor threads
+_DIRECT = Qt.ConnectionType.DirectConnection
+_QUEUED = Qt.ConnectionType.QueuedConnection
+
+# Last service state shown by the tray, painted at startup before the first poll
+STATUS_CACHE_NAME = "tray_status.json"
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory for the control panel (outside the source tree)"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ha-bridge"
+
+
+_STATUS_FIELDS = ("running", "health", "pid")
+
+# Tray menu layout: (label, attribute, slot, checkable); None marks a separator.
+# An action without a slot is a disabled, informational entry.
+_MENU_SPEC = (
+    ("Show Control Panel", "show_action", "show_control_panel", False),
+    ("Service Status: Unknown", "status_action", None, False),
+    None,
+    ("Start Service", "start_action", "start_service", False),
+    ("Stop Service", "stop_action", "stop_service", False),
+    ("Restart Service", "restart_action", "restart_service", False),
+    None,
+    ("Run on Startup", "startup_action", "toggle_startup", True),
+    None,
+    ("Exit", "exit_action", "exit_app", False),
+)
+
 
 class ServiceMonitor(QObject):
-    """Monitors service status in background thread"""
+    """Monitors service status in background thread
+
+    Lives on its own QThread (see SystemTrayApp) together with its poll timer,
+    so slow status probes never stall the tray. Polls adaptively: at the
+    configured status interval after a state change, backing off to the
+    configured ceiling while the service stays in the same state.
+    """
 
-    status_changed = pyqtSignal(dict)
+    state_changed = pyqtSignal(dict)  # running, health or PID changed
+    uptime_changed = pyqtSignal(dict)  # same state, only the uptime moved on
 
     def __init__(self, service_controller: ServiceController):
         super().__init__()
         self.service_controller = service_controller
-        self.last_status = None
-
-    def check_status(self):
-        """Check service status and emit signal if changed"""
+        self._last_state = None
+        self._last_uptime = None
+
+        polling = ui_config.get_all_settings().polling
+        self._min_interval = polling.status_interval
+        self._max_interval = polling.status_max_interval
+        self._interval_ms = self._min_interval
+
+        # Parented to the monitor, so moveToThread takes the timer along
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.check_status, _DIRECT)
+
+    @staticmethod
+    def _state(status: dict) -> tuple:
+        """Fields that define the service state (uptime aside)"""
+        return status["running"], status["health"], status["pid"]
+
+    @pyqtSlot()
+    def check_status(self) -> bool:
+        """Check service status, emit what changed and schedule the next poll"""
+        changed = False
         try:
             status = self.service_controller.get_service_status()
 
-            # Only emit if status actually changed
-            if status != self.last_status:
-                self.status_changed.emit(status)
-                self.last_status = status
-
-        except Exception as e:
+            # Full UI refresh only on a real state change; uptime is cheap text
+            state = self._state(status)
+            changed = state != self._last_state
+            if changed:
+                self.state_changed.emit(status)
+            elif status["uptime"] != self._last_uptime:
+                self.uptime_changed.emit(status)
+            self._last_state = state
+            self._last_uptime = status["uptime"]
+
+        except (OSError, RuntimeError, psutil.Error) as e:
             logger.error(f"Service monitor error: {e}")
+        except Exception as e:
+            # This loop alone keeps the tray state current, so never let an
+            # unexpected error (which PyQt6 would turn into an abort) end it
+            logger.error(f"Unexpected service monitor error: {e}", exc_info=True)
+        finally:
+            if changed:
+                self._interval_ms = self._min_interval
+            else:
+                self._interval_ms = min(self._interval_ms * 2, self._max_interval)
+            self.timer.start(self._interval_ms)
+        return changed
+
+    @pyqtSlot()
+    def check_now(self):
+        """Poll immediately and return to the fastest interval (user interaction)"""
+        self._interval_ms = self._min_interval
+        self.check_status()
 
 
 class SystemTrayApp(QSystemTrayIcon):
     """System tray application with service control"""
 
+    refresh_requested = pyqtSignal()  # ask the monitor for an immediate poll
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -50,132 +160,182 @@ class SystemTrayApp(QSystemTrayIcon):
         self.service_controller = ServiceController()
         self.startup_manager = StartupManager()
 
+        # Balloon support doesn't change at runtime; without it, notify by log
+        self._can_notify = self.supportsMessages()
+
+        # Service actions run on the thread pool, one at a time
+        self._action_inflight = False
+
+        # Control panel, created on first show
+        self.main_window: Optional["MainWindow"] = None
+
+        # What the tray currently shows, so unchanged updates skip the platform
+        self._current_icon = None
+        self._current_tooltip = None
+        self._status_cache_file = _user_cache_dir() / STATUS_CACHE_NAME
+        self._cached_state: Optional[Dict[str, Any]] = None
+
         # Setup tray icon
         self.setup_tray_icon()
         self.setup_menu()
 
-        # Setup monitoring
+        # The startup setting only changes through the menu, so read it once
+        # here and again whenever the menu opens, not on every status change
+        self.refresh_startup_action()
+        self.menu.aboutToShow.connect(self.refresh_startup_action, _DIRECT)
+
+        # Paint the last known state instead of "Unknown" until the first poll
+        self._apply_cached_status()
+
+        # Setup monitoring on a worker thread; its signals queue back to the UI
         self.monitor = ServiceMonitor(self.service_controller)
-        self.monitor.status_changed.connect(self.on_status_changed)
+        self._monitor_thread = QThread(self)
+        self.monitor.moveToThread(self._monitor_thread)
+        self.monitor.state_changed.connect(self.on_state_changed, _QUEUED)
+        self.monitor.uptime_changed.connect(self.on_uptime_changed, _QUEUED)
 
-        # Start monitoring timer
-        self.monitor_timer = QTimer()
-        self.monitor_timer.timeout.connect(self.monitor.check_status)
-        self.monitor_timer.start(5000)  # Check every 5 seconds
+        # Initial status check (which also schedules the next poll)
+        self._monitor_thread.started.connect(self.monitor.check_status, _DIRECT)
 
-        # Initial status check
-        self.monitor.check_status()
+        # Opening the menu shows fresh status and resets the backoff
+        self.menu.aboutToShow.connect(self.monitor.check_now, _QUEUED)
+        self.refresh_requested.connect(self.monitor.check_now, _QUEUED)
+
+        self._monitor_thread.start()
 
         # Connect signals
-        self.activated.connect(self.on_tray_activated)
+        self.activated.connect(self.on_tray_activated, _DIRECT)
 
     def setup_tray_icon(self):
         """Setup the tray icon"""
         try:
-            # Load icons
-            icons_dir = Path(__file__).parent / "assets" / "icons"
-            self.icon_active = QIcon(str(icons_dir / "tray_icon_active.png"))
-            self.icon_inactive = QIcon(str(icons_dir / "tray_icon_inactive.png"))
-            self.icon_unknown = QIcon(str(icons_dir / "tray_icon_unknown.png"))
+            # Load icons (shared, decoded once per process)
+            self.icon_active = get_tray_icon("active")
+            self.icon_inactive = get_tray_icon("inactive")
+            self.icon_unknown = get_tray_icon("unknown")
 
             # Set initial icon
-            self.setIcon(self.icon_unknown)
-            self.setToolTip("HA Bridge Service - Unknown")
+            self._show_icon(self.icon_unknown, "HA Bridge Service - Unknown")
 
         except Exception as e:
             logger.error(f"Failed to setup tray icon: {e}")
-            # Fallback to system icon
-            self.setIcon(
-                QApplication.style().standardIcon(
-                    QApplication.style().StandardPixmap.SP_ComputerIcon
-                )
-            )
+            # Fallback to the system icon for every state
+            style = QApplication.style()
+            fallback = style.standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+            self.icon_active = self.icon_inactive = self.icon_unknown = fallback
+            self._show_icon(fallback, "HA Bridge Service - Unknown")
 
     def setup_menu(self):
         """Setup the context menu"""
         self.menu = QMenu()
 
-        # Show Control Panel action
-        self.show_action = QAction("Show Control Panel", self)
-        self.show_action.triggered.connect(self.show_control_panel)
-        self.menu.addAction(self.show_action)
-
-        # Service status
-        self.status_action = QAction("Service Status: Unknown", self)
-        self.status_action.setEnabled(False)
-        self.menu.addAction(self.status_action)
-
-        self.menu.addSeparator()
-
-        # Service control actions
-        self.start_action = QAction("Start Service", self)
-        self.start_action.triggered.connect(self.start_service)
-        self.menu.addAction(self.start_action)
-
-        self.stop_action = QAction("Stop Service", self)
-        self.stop_action.triggered.connect(self.stop_service)
-        self.menu.addAction(self.stop_action)
-
-        self.restart_action = QAction("Restart Service", self)
-        self.restart_action.triggered.connect(self.restart_service)
-        self.menu.addAction(self.restart_action)
-
-        self.menu.addSeparator()
-
-        # Startup control
-        self.startup_action = QAction("Run on Startup", self)
-        self.startup_action.setCheckable(True)
-        self.startup_action.triggered.connect(self.toggle_startup)
-        self.menu.addAction(self.startup_action)
-
-        self.menu.addSeparator()
+        for entry in _MENU_SPEC:
+            if entry is None:
+                self.menu.addSeparator()
+                continue
 
-        # Exit action
-        self.exit_action = QAction("Exit", self)
-        self.exit_action.triggered.connect(self.exit_app)
-        self.menu.addAction(self.exit_action)
+            label, attribute, slot, checkable = entry
+            action = QAction(label, self)
+            action.setCheckable(checkable)
+            if slot is None:
+                action.setEnabled(False)
+            else:
+                action.triggered.connect(getattr(self, slot), _DIRECT)
+            self.menu.addAction(action)
+            setattr(self, attribute, action)
 
         # Set the menu
         self.setContextMenu(self.menu)
 
-    def on_status_changed(self, status: dict):
-        """Handle service status changes"""
-        try:
-            # Update icon
-            if status["running"]:
-                if status["health"]:
-                    self.setIcon(self.icon_active)
-                    tooltip = f"HA Bridge Service - Running (PID: {status['pid']})"
-                else:
-                    self.setIcon(self.icon_inactive)
-                    tooltip = "HA Bridge Service - Running but unhealthy"
-            else:
-                self.setIcon(self.icon_inactive)
-                tooltip = "HA Bridge Service - Stopped"
+    def _show_icon(self, icon: QIcon, tooltip: str):
+        """Set the tray icon and tooltip, skipping whichever is unchanged
 
+        Each change is a round-trip to the platform tray (an IPC to the
+        status-notifier host on X11), so identical updates are dropped.
+        """
+        if icon is not self._current_icon:
+            self.setIcon(icon)
+            self._current_icon = icon
+        if tooltip != self._current_tooltip:
             self.setToolTip(tooltip)
-
-            # Update menu
-            if status["running"]:
-                status_text = f"Service Status: Running (PID: {status['pid']})"
-                if status["uptime"]:
-                    status_text += f" - Uptime: {status['uptime']}"
+            self._current_tooltip = tooltip
+
+    @pyqtSlot(dict)
+    def on_state_changed(self, status: dict):
+        """Handle service state changes (running, health or PID)"""
+        if status["running"]:
+            if status["health"]:
+                icon = self.icon_active
+                tooltip = f"HA Bridge Service - Running (PID: {status['pid']})"
             else:
-                status_text = "Service Status: Stopped"
+                icon = self.icon_inactive
+                tooltip = "HA Bridge Service - Running but unhealthy"
+        else:
+            icon = self.icon_inactive
+            tooltip = "HA Bridge Service - Stopped"
 
-            self.status_action.setText(status_text)
+        self._show_icon(icon, tooltip)
 
-            # Update action states
-            self.start_action.setEnabled(not status["running"])
-            self.stop_action.setEnabled(status["running"])
-            self.restart_action.setEnabled(True)
+        # Update menu
+        self.status_action.setText(self._status_text(status))
 
-            # Update startup status
-            startup_enabled = self.startup_manager.is_startup_enabled()
-            self.startup_action.setChecked(startup_enabled)
+        # Update action states
+        self.start_action.setEnabled(not status["running"])
+        self.stop_action.setEnabled(status["running"])
+        self.restart_action.setEnabled(True)
 
-        except Exception as e:
-            logger.error(f"Error updating status: {e}")
+        self._save_cached_status(status)
+
+    def _apply_cached_status(self):
+        """Show the state persisted by the previous run, if there is one"""
+        try:
+            data = json.loads(self._status_cache_file.read_text(encoding="utf-8"))
+            state = {field: data[field] for field in _STATUS_FIELDS}
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring tray status cache: {e}")
+            return
+
+        self._cached_state = state
+        self.on_state_changed({**state, "uptime": None})
+
+    def _save_cached_status(self, status: dict):
+        """Persist the state fields atomically, skipping unchanged writes"""
+        state = {field: status[field] for field in _STATUS_FIELDS}
+        if state == self._cached_state:
+            return
+
+        tmp_file = self._status_cache_file.with_suffix(".json.tmp")
+        try:
+            tmp_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp_file, self._status_cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save tray status cache: {e}")
+            return
+        self._cached_state = state
+
+    @pyqtSlot(dict)
+    def on_uptime_changed(self, status: dict):
+        """Refresh the uptime shown in the menu"""
+        self.status_action.setText(self._status_text(status))
+
+    @staticmethod
+    def _status_text(status: dict) -> str:
+        """Menu text describing the service status"""
+        if not status["running"]:
+            return "Service Status: Stopped"
+
+        status_text = f"Service Status: Running (PID: {status['pid']})"
+        if status["uptime"]:
+            status_text += f" - Uptime: {status['uptime']}"
+        return status_text
+
+    @pyqtSlot()
+    def refresh_startup_action(self):
+        """Sync the "Run on Startup" checkmark with the startup manager"""
+        self.startup_action.setChecked(self.startup_manager.is_startup_enabled())
 
     def on_tray_activated(self, reason):
         """Handle tray icon activation"""
@@ -191,7 +351,7 @@ class SystemTrayApp(QSystemTrayIcon):
             # Import here to avoid circular imports
             from ui.main_window import MainWindow
 
-            if not hasattr(self, "main_window") or self.main_window is None:
+            if self.main_window is None:
                 self.main_window = MainWindow(
                     self.service_controller, self.startup_manager
                 )
@@ -204,109 +364,81 @@ class SystemTrayApp(QSystemTrayIcon):
             logger.error(f"Failed to show control panel: {e}")
             QMessageBox.critical(None, "Error", f"Failed to open control panel: {e}")
 
-    def start_service(self):
-        """Start the service"""
-        try:
-            result = self.service_controller.start_service()
-            if result["success"]:
-                self.showMessage(
-                    "Service Started",
-                    result["message"],
-                    QSystemTrayIcon.MessageIcon.Information,
-                    3000,
-                )
-            else:
-                self.showMessage(
-                    "Start Failed",
-                    result["message"],
-                    QSystemTrayIcon.MessageIcon.Critical,
-                    5000,
-                )
-        except Exception as e:
-            logger.error(f"Failed to start service: {e}")
-            self.showMessage(
+    def _run_service_action(
+        self, action: Callable[[], Dict[str, Any]], verb: str, done_title: str
+    ):
+        """Run a service action on the thread pool, keeping the tray responsive"""
+        if self._action_inflight:
+            return
+
+        self._action_inflight = True
+        job = FunctionJob(action)
+        job.signals.result.connect(
+            partial(self._on_action_done, verb, done_title), _QUEUED
+        )
+        QThreadPool.globalInstance().start(job)
+
+    def _on_action_done(
+        self, verb: str, done_title: str, result: Optional[Dict[str, Any]]
+    ):
+        """Report a finished service action as a tray notification"""
+        self._action_inflight = False
+        critical = QSystemTrayIcon.MessageIcon.Critical
+        if result is None:
+            self.show_notification(
                 "Error",
-                f"Failed to start service: {e}",
-                QSystemTrayIcon.MessageIcon.Critical,
+                f"Failed to {verb.lower()} service - see ui.log",
+                critical,
                 5000,
             )
+        elif result["success"]:
+            self.show_notification(done_title, result["message"])
+        else:
+            self.show_notification(f"{verb} Failed", result["message"], critical, 5000)
+
+        # Show the new state now rather than at the next (backed-off) poll
+        self.refresh_requested.emit()
+
+    def start_service(self):
+        """Start the service"""
+        self._run_service_action(
+            self.service_controller.start_service, "Start", "Service Started"
+        )
 
     def stop_service(self):
         """Stop the service"""
-        try:
-            result = self.service_controller.stop_service()
-            if result["success"]:
-                self.showMessage(
-                    "Service Stopped",
-                    result["message"],
-                    QSystemTrayIcon.MessageIcon.Information,
-                    3000,
-                )
-            else:
-                self.showMessage(
-                    "Stop Failed",
-                    result["message"],
-                    QSystemTrayIcon.MessageIcon.Critical,
-                    5000,
-                )
-        except Exception as e:
-            logger.error(f"Failed to stop service: {e}")
-            self.showMessage(
-                "Error",
-                f"Failed to stop service: {e}",
-                QSystemTrayIcon.MessageIcon.Critical,
-                5000,
-            )
+        self._run_service_action(
+            self.service_controller.stop_service, "Stop", "Service Stopped"
+        )
 
     def restart_service(self):
         """Restart the service"""
-        try:
-            result = self.service_controller.restart_service()
-            if result["success"]:
-                self.showMessage(
-                    "Service Restarted",
-                    result["message"],
-                    QSystemTrayIcon.MessageIcon.Information,
-                    3000,
-                )
-            else:
-                self.showMessage(
-                    "Restart Failed",
-                    result["message"],
-                    QSystemTrayIcon.MessageIcon.Critical,
-                    5000,
-                )
-        except Exception as e:
-            logger.error(f"Failed to restart service: {e}")
-            self.showMessage(
-                "Error",
-                f"Failed to restart service: {e}",
-                QSystemTrayIcon.MessageIcon.Critical,
-                5000,
-            )
+        self._run_service_action(
+            self.service_controller.restart_service, "Restart", "Service Restarted"
+        )
 
     def toggle_startup(self):
         """Toggle startup setting"""
         try:
-            if self.startup_manager.toggle_startup():
-                startup_enabled = self.startup_manager.is_startup_enabled()
+            toggled = self.startup_manager.toggle_startup()
+            # Undo the action's own auto-toggle if the registry didn't change
+            startup_enabled = self.startup_manager.is_startup_enabled()
+            self.startup_action.setChecked(startup_enabled)
+            if toggled:
                 status = "enabled" if startup_enabled else "disabled"
-                self.showMessage(
-                    "Startup Setting",
-                    f"Startup {status} successfully",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    3000,
+                self.show_notification(
+                    "Startup Setting", f"Startup {status} successfully"
                 )
             else:
-                self.showMessage(
+                self.show_notification(
                     "Startup Error",
                     "Failed to toggle startup setting",
                     QSystemTrayIcon.MessageIcon.Critical,
                     5000,
                 )
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Failed to toggle startup: {e}")
-            self.showMessage(
+            self.show_notification(
                 "Error",
                 f"Failed to toggle startup: {e}",
                 QSystemTrayIcon.MessageIcon.Critical,
@@ -316,14 +448,19 @@ class SystemTrayApp(QSystemTrayIcon):
     def exit_app(self):
         """Exit the application"""
         try:
-            # Stop monitoring
-            if hasattr(self, "monitor_timer"):
-                self.monitor_timer.stop()
+            # Stop monitoring (the poll timer stops with the thread's event loop);
+            # cancelling the probes frees a poll blocked on a health check
+            self._monitor_thread.quit()
+            self.service_controller.cancel_probes()
+            self._monitor_thread.wait(2000)
 
             # Close main window if open
-            if hasattr(self, "main_window") and self.main_window:
+            if self.main_window is not None:
                 self.main_window.close()
 
+            # Release the controller's HTTP connections and probe thread
+            self.service_controller.close()
+
             # Exit application
             QApplication.quit()
 
@@ -336,6 +473,10 @@ class SystemTrayApp(QSystemTrayIcon):
         title: str,
         message: str,
         icon_type: QSystemTrayIcon.MessageIcon = QSystemTrayIcon.MessageIcon.Information,
+        timeout_ms: int = 3000,
     ):
-        """Show a system notification"""
-        self.showMessage(title, message, icon_type, 3000)
+        """Show a system notification (logged instead if the tray has no balloons)"""
+        if self._can_notify:
+            self.showMessage(title, message, icon_type, timeout_ms)
+        else:
+            logger.info(f"Tray message suppressed: {title} - {message}")
@@ -0,0 +1,98 @@
+"""
+Background Workers for HA Bridge Control UI
+Runs blocking service controller calls on the Qt thread pool
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ui.service_controller import ServiceController, StatusDict
+
+logger = logging.getLogger(__name__)
+
+
+class StatusUpdate(StatusDict, total=False):
+    """Service status plus WebSocket status (None unless the service is healthy)"""
+
+    websocket: Optional[Dict[str, Any]]
+
+
+class WorkerSignals(QObject):
+    """Signals used to marshal worker results back to the UI thread"""
+
+    result = pyqtSignal(object)
+
+
+class StatusWorker(QRunnable):
+    """Fetches service status (and WebSocket status when healthy) off the UI thread"""
+
+    def __init__(self, service_controller: ServiceController):
+        super().__init__()
+        self.service_controller = service_controller
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Collect status and emit it to the UI thread"""
+        try:
+            status: StatusUpdate = {
+                **self.service_controller.get_service_status(),
+                "websocket": None,
+            }
+            if status["running"] and status["health"]:
+                status["websocket"] = self.service_controller.get_websocket_status()
+        except Exception as e:
+            logger.error(f"Status worker error: {e}")
+            status = {
+                "running": False,
+                "pid": None,
+                "uptime": None,
+                "health": False,
+                "url": self.service_controller.service_url,
+                "error": str(e),
+                "websocket": None,
+            }
+
+        self.signals.result.emit(status)
+
+
+class LogsWorker(QRunnable):
+    """Reads the service log tail off the UI thread"""
+
+    def __init__(self, service_controller: ServiceController, lines: int = 50):
+        super().__init__()
+        self.service_controller = service_controller
+        self.lines = lines
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Read logs and emit them to the UI thread"""
+        try:
+            logs = self.service_controller.get_service_logs(self.lines)
+        except Exception as e:
+            logger.error(f"Logs worker error: {e}")
+            logs = [f"Error reading logs: {e}"]
+
+        self.signals.result.emit(logs)
+
+
+class FunctionJob(QRunnable):
+    """Runs an arbitrary callable on the thread pool and emits its return value"""
+
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Call the function and emit its result"""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Background job {self.fn!r} failed: {e}")
+            result = None
+
+        self.signals.result.emit(result)
@@ -6,10 +6,14 @@ Entry point for the control panel application
 import sys
 import os
 import argparse
+import importlib.util
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPalette, QColor
 
 # Add the project root to Python path
@@ -17,52 +21,109 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from ui.tray_app import SystemTrayApp
+from ui.theme import load_stylesheet
+from ui.icon_cache import preload_tray_icons
 from ui.service_controller import ServiceController
 from ui.startup_manager import StartupManager
 from app.config.ui_config import ui_config
 
-# Setup logging
+# Setup logging: ui.log rotates at 1 MB, and records are written in batches
+# (every 200 records, on any warning, and at exit via logging.shutdown)
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+ui_log_handler = RotatingFileHandler(
+    "ui.log", maxBytes=1_000_000, backupCount=3, encoding="utf-8"
+)
+ui_log_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+ui_log_buffer = MemoryHandler(
+    capacity=200, flushLevel=logging.WARNING, target=ui_log_handler
+)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("ui.log"), logging.StreamHandler()],
+    format=LOG_FORMAT,
+    handlers=[ui_log_buffer, logging.StreamHandler()],
 )
 
 logger = logging.getLogger(__name__)
 
 
-def setup_dark_theme(app: QApplication):
-    """Apply dark theme to the entire application"""
-    app.setStyle("Fusion")
-
-    # Create dark palette
-    palette = QPalette()
+def clear_ui_log():
+    """Empty ui.log in place through the handler's own open stream
 
+    Truncating the stream we already hold avoids reopening a file this
+    process has open, which Windows refuses with a sharing violation.
+    """
+    ui_log_buffer.flush()
+    ui_log_handler.acquire()
+    try:
+        if ui_log_handler.stream is not None:
+            ui_log_handler.stream.seek(0)
+            ui_log_handler.stream.truncate()
+        else:
+            os.truncate(ui_log_handler.baseFilename, 0)
+    finally:
+        ui_log_handler.release()
+
+
+_ALL = QPalette.ColorGroup.All
+_DISABLED = QPalette.ColorGroup.Disabled
+_LIGHT_TEXT = QColor(224, 224, 224)
+_WHITE = QColor(255, 255, 255)
+_GREY_TEXT = QColor(128, 128, 128)
+
+# (group, role, color) for the dark palette
+_DARK_PALETTE_SPEC = (
     # Window colors
-    palette.setColor(QPalette.ColorRole.Window, QColor(30, 30, 30))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(224, 224, 224))
-
+    (_ALL, QPalette.ColorRole.Window, QColor(30, 30, 30)),
+    (_ALL, QPalette.ColorRole.WindowText, _LIGHT_TEXT),
     # Base colors
-    palette.setColor(QPalette.ColorRole.Base, QColor(45, 45, 45))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(60, 60, 60))
-
+    (_ALL, QPalette.ColorRole.Base, QColor(45, 45, 45)),
+    (_ALL, QPalette.ColorRole.AlternateBase, QColor(60, 60, 60)),
     # Text colors
-    palette.setColor(QPalette.ColorRole.Text, QColor(224, 224, 224))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-
+    (_ALL, QPalette.ColorRole.Text, _LIGHT_TEXT),
+    (_ALL, QPalette.ColorRole.BrightText, _WHITE),
     # Button colors
-    palette.setColor(QPalette.ColorRole.Button, QColor(64, 64, 64))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(224, 224, 224))
-
+    (_ALL, QPalette.ColorRole.Button, QColor(64, 64, 64)),
+    (_ALL, QPalette.ColorRole.ButtonText, _LIGHT_TEXT),
     # Highlight colors
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(0, 122, 204))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
+    (_ALL, QPalette.ColorRole.Highlight, QColor(0, 122, 204)),
+    (_ALL, QPalette.ColorRole.HighlightedText, _WHITE),
+    # Disabled colors (only for the disabled group)
+    (_DISABLED, QPalette.ColorRole.WindowText, _GREY_TEXT),
+    (_DISABLED, QPalette.ColorRole.Text, _GREY_TEXT),
+)
+
+_dark_palette: Optional[QPalette] = None
+
+
+def dark_palette() -> QPalette:
+    """Get the dark palette, built on first use (needs a QApplication)"""
+    global _dark_palette
+    if _dark_palette is None:
+        _dark_palette = QPalette()
+        for group, role, color in _DARK_PALETTE_SPEC:
+            _dark_palette.setColor(group, role, color)
+    return _dark_palette
+
+
+def setup_dark_theme(app: QApplication):
+    """Apply dark theme to the entire application"""
+    app.setStyle("Fusion")
+    app.setPalette(dark_palette())
+
+    # Application-wide stylesheet (parsed once for every window)
+    app.setStyleSheet(load_stylesheet())
+
 
-    # Disabled colors
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(128, 128, 128))
-    palette.setColor(QPalette.ColorRole.Text, QColor(128, 128, 128))
+def show_startup_window(tray_app: SystemTrayApp, startup_behavior: str):
+    """Show the main control window according to the startup behavior"""
+    logger.info("Showing main control window")
+    tray_app.show_control_panel()
 
-    app.setPalette(palette)
+    # Minimize after showing if requested
+    window = tray_app.main_window
+    if startup_behavior == "show_then_minimize" and window is not None:
+        # Hide once the window has actually appeared, after a brief glimpse
+        window.shown_once.connect(lambda: QTimer.singleShot(200, window.hide))
 
 
 def parse_arguments():
@@ -89,27 +150,21 @@ def parse_arguments():
 
 def check_dependencies():
     """Check if all required dependencies are available"""
-    missing_deps = []
-
-    try:
-        import PyQt6
-    except ImportError:
-        missing_deps.append("PyQt6")
-
-    try:
-        import psutil
-    except ImportError:
-        missing_deps.append("psutil")
+    # PyQt6 is already imported above, so only probe for the rest; find_spec
+    # locates a package without running its initialisation
+    missing_deps = [
+        name for name in ("psutil",) if importlib.util.find_spec(name) is None
+    ]
 
     if missing_deps:
         error_msg = f"Missing required dependencies: {', '.join(missing_deps)}\n"
         error_msg += "Please install them with: pip install " + " ".join(missing_deps)
 
-        # Try to show error in GUI if possible
+        # Try to show error in GUI if possible (reusing any existing app)
         try:
-            app = QApplication([])
+            app = QApplication.instance() or QApplication([])
             QMessageBox.critical(None, "Missing Dependencies", error_msg)
-        except:
+        except Exception:
             pass
 
         print(error_msg)
@@ -130,23 +185,33 @@ def main():
         # Check dependencies
         check_dependencies()
 
-        # Create QApplication
-        app = QApplication(sys.argv)
-        app.setQuitOnLastWindowClosed(False)  # Keep running when window is closed
+        # The controllers hold no QObjects, so build them (HTTP client, startup
+        # paths) on a worker while Qt loads its platform plugin on this thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            controller_future = executor.submit(ServiceController, str(project_root))
+            startup_future = executor.submit(StartupManager)
+
+            # Create QApplication
+            app = QApplication(sys.argv)
+            app.setQuitOnLastWindowClosed(False)  # Keep running when window closed
 
-        # Set application properties
-        app.setApplicationName("HA Bridge Control Panel")
-        app.setApplicationVersion("1.0.0")
-        app.setOrganizationName("HA Bridge")
+            # Set application properties
+            app.setApplicationName("HA Bridge Control Panel")
+            app.setApplicationVersion("1.0.0")
+            app.setOrganizationName("HA Bridge")
 
-        # Apply dark theme
-        setup_dark_theme(app)
+            # Apply dark theme
+            setup_dark_theme(app)
 
-        # Initialize components
-        logger.info("Initializing HA Bridge Control Panel...")
+            # Decode tray icons up front so status changes swap them instantly
+            preload_tray_icons()
 
-        service_controller = ServiceController(str(project_root))
-        startup_manager = StartupManager()
+            # Initialize components
+            logger.info("Initializing HA Bridge Control Panel...")
+
+            service_controller = controller_future.result()
+            app.aboutToQuit.connect(service_controller.close)
+            startup_manager = startup_future.result()
 
         # Load UI settings
         settings = ui_config.get_all_settings()
@@ -164,17 +229,11 @@ def main():
                 logger.warning("Service logs could not be cleared (file may be locked)")
             
             # Also clear UI log
-            ui_log_file = project_root / "ui.log"
-            if ui_log_file.exists():
-                try:
-                    # Use truncation approach for UI log too
-                    with open(ui_log_file, 'w', encoding='utf-8') as f:
-                        f.truncate(0)
-                    logger.info("UI log cleared successfully")
-                except PermissionError as e:
-                    logger.warning(f"UI log could not be cleared - file is locked: {e}")
-                except Exception as e:
-                    logger.error(f"Failed to clear UI log: {e}")
+            try:
+                clear_ui_log()
+                logger.info("UI log cleared successfully")
+            except OSError as e:
+                logger.error(f"Failed to clear UI log: {e}")
 
         # Auto-start service if requested and not running
         if args.auto_start_service or settings.service.auto_start:
@@ -193,24 +252,6 @@ def main():
         # Show main window based on startup mode
         startup_behavior = args.startup_mode or settings.startup.startup_behavior
 
-        if not args.minimized and startup_behavior != "minimized":
-            logger.info("Showing main control window")
-            tray_app.show_control_panel()
-
-            # Minimize after showing if requested
-            if startup_behavior == "show_then_minimize":
-                # Delay minimization to allow window to show first
-                from PyQt6.QtCore import QTimer
-
-                QTimer.singleShot(
-                    2000,
-                    lambda: (
-                        tray_app.main_window.hide()
-                        if hasattr(tray_app, "main_window")
-                        else None
-                    ),
-                )
-
         logger.info("HA Bridge Control Panel started successfully")
         logger.info(f"Startup behavior: {startup_behavior}")
         logger.info(
@@ -220,6 +261,13 @@ def main():
         # Show system tray
         tray_app.show()
 
+        # Build the main window on the first event-loop pass, once the tray
+        # icon is already up
+        if not args.minimized and startup_behavior != "minimized":
+            QTimer.singleShot(
+                0, lambda: show_startup_window(tray_app, startup_behavior)
+            )
+
         # Run application
         sys.exit(app.exec())
 